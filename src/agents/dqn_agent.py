@@ -248,6 +248,9 @@ class DQNAgent(StrategicAgent):
         
         # Game state reference
         self.game_state = None
+        
+        # Compiled multi-batch training steps, built on first use by train_on_batches
+        self._multi_batch_steps = {}
 
 
     def _init_networks(self):
@@ -449,7 +452,12 @@ class DQNAgent(StrategicAgent):
             return property_tile.price * 1.2  # Simple fallback value
 
 
-    def encode_state(self, game_state: GameState, property_tile: Optional[Tile] = None) -> np.ndarray:
+    def encode_state(
+        self,
+        game_state: GameState,
+        property_tile: Optional[Tile] = None,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Encode game state into feature vector for neural network input.
         
@@ -463,11 +471,14 @@ class DQNAgent(StrategicAgent):
             Current game state to encode
         property_tile : Optional[Tile], default None
             Specific property being considered (for buying decisions)
+        out : Optional[np.ndarray], default None
+            Preallocated float32 array of length state_dim to write the
+            features into instead of allocating a new one
             
         Returns
         -------
         np.ndarray
-            Normalized feature vector of length state_dim
+            Normalized feature vector of length state_dim (out, if given)
         """
 
         # Determine the current player and opponent
@@ -705,6 +716,11 @@ class DQNAgent(StrategicAgent):
         # Ensure we have exactly state_dim features
         assert len(features) <= self.state_dim, f"Feature count {len(features)} exceeds state_dim {self.state_dim}"
         
+        if out is not None:
+            out[:len(features)] = features
+            out[len(features):] = 0.0
+            return out
+        
         # Pad if necessary
         if len(features) < self.state_dim:
             features.extend([0.0] * (self.state_dim - len(features)))
@@ -1978,6 +1994,115 @@ class DQNAgent(StrategicAgent):
         return loss.numpy()  # Return loss value for tracking
 
 
+    def _build_multi_batch_step(self, method: str):
+        """
+        Build a compiled function running one training step per stacked batch.
+        
+        Parameters
+        ----------
+        method : str
+            The decision method to train
+            
+        Returns
+        -------
+        Callable
+            Function taking (states, actions, rewards, next_states, dones) tensors
+            shaped (num_batches, batch_size, ...) and returning the loss of each batch
+        """
+        q_network = self.q_networks[method]
+        target_network = self.target_networks[method]
+        optimizer = self.optimizers[method]
+        action_dim = self.action_dims[method]
+        huber = tf.keras.losses.Huber()
+        gamma = self.gamma
+        
+        @tf.function
+        def multi_batch_step(states, actions, rewards, next_states, dones):
+            num_batches = tf.shape(states)[0]
+            losses = tf.TensorArray(tf.float32, size=num_batches)
+            
+            for i in tf.range(num_batches):
+                batch_actions = actions[i]
+                
+                # Handle special case for get_upgrading_suggestions where -1 means no upgrade
+                if method == 'get_upgrading_suggestions':
+                    batch_actions = tf.where(batch_actions == -1, action_dim - 1, batch_actions)
+                
+                with tf.GradientTape() as tape:
+                    # Q-values for the actions taken
+                    q_values = q_network(states[i])
+                    action_masks = tf.one_hot(batch_actions, depth=action_dim)
+                    q_values_for_actions = tf.reduce_sum(q_values * action_masks, axis=1)
+                    
+                    # Target Q-values
+                    next_q_values_max = tf.reduce_max(target_network(next_states[i]), axis=1)
+                    targets = rewards[i] + (1.0 - dones[i]) * gamma * next_q_values_max
+                    
+                    # Compute loss (using Huber loss for stability)
+                    loss = huber(targets, q_values_for_actions)
+                
+                gradients = tape.gradient(loss, q_network.trainable_variables)
+                optimizer.apply_gradients(zip(gradients, q_network.trainable_variables))
+                losses = losses.write(i, loss)
+            
+            return losses.stack()
+        
+        return multi_batch_step
+
+
+    def train_on_batches(
+        self,
+        method: str,
+        states: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_states: np.ndarray,
+        dones: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """
+        Train Q-network on several batches in a single compiled call.
+        
+        Each batch gets its own gradient step, as with train_on_batch, but the
+        steps run inside one TensorFlow graph instead of one eager call each.
+        
+        Parameters
+        ----------
+        method : str
+            The decision method to train
+        states, next_states : np.ndarray
+            Stacked batches of states, shaped (num_batches, batch_size, state_dim)
+        actions, rewards, dones : np.ndarray
+            Stacked batches, shaped (num_batches, batch_size)
+            
+        Returns
+        -------
+        Optional[np.ndarray]
+            Loss of each batch, or None if the method has no Q-network
+        """
+        if method not in self.q_networks:
+            return
+        
+        if method not in self._multi_batch_steps:
+            self._multi_batch_steps[method] = self._build_multi_batch_step(method)
+        
+        losses = self._multi_batch_steps[method](
+            tf.convert_to_tensor(states, dtype=tf.float32),
+            tf.convert_to_tensor(actions, dtype=tf.int32),
+            tf.convert_to_tensor(rewards, dtype=tf.float32),
+            tf.convert_to_tensor(next_states, dtype=tf.float32),
+            tf.convert_to_tensor(dones, dtype=tf.float32)
+        )
+        
+        # Update target network when a multiple of the update frequency was crossed
+        num_batches = len(losses)
+        previous_updates = self.update_counter
+        self.update_counter += num_batches
+        if self.update_counter // self.target_update_freq > previous_updates // self.target_update_freq:
+            self.target_networks[method].set_weights(self.q_networks[method].get_weights())
+        
+        return losses.numpy()
+
+
     def save_model_for_method(self, method: str, path: str):
         """
         Save neural network weights and parameters for a specific method.
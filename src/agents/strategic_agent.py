@@ -1,7 +1,12 @@
-from typing import List, Dict, Optional, Set, Tuple
+from typing import List, Dict, Iterator, Optional, Sequence, Set, Tuple
 import random
 import math
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+import heapq
+from itertools import chain
+from operator import attrgetter, itemgetter
+import numpy as np
 
 from game.player import Player
 from game.game_state import GameState
@@ -13,6 +18,79 @@ from models.property import Property
 from models.railway import Railway
 from models.utility import Utility
 from models.trade_offer import TradeOffer
+from events.events import EventType
+
+
+# Cash tiers used by _evaluate_cash_impact, as sorted thresholds and the value
+# of each bucket (one more value than thresholds)
+CASH_FLEXIBILITY_THRESHOLDS = (300, 500, 800)
+CASH_FLEXIBILITY_VALUES = (0.1, 0.4, 0.7, 1.0)
+CASH_RISK_THRESHOLDS = (100, 200, 400)
+CASH_RISK_VALUES = (1.0, 0.8, 0.5, 0.2)
+
+
+def _cash_impact_core(new_cash: int, net_worth: int, min_cash_reserve: int) -> Tuple[float, float, float, float]:
+    """
+    Scalar part of the cash impact evaluation, kept free of game objects.
+    
+    Args:
+        new_cash: Cash after the evaluated change
+        net_worth: Current net worth of the player
+        min_cash_reserve: Minimum cash the player wants to keep
+        
+    Returns:
+        Tuple of (liquidity_ratio, safety_margin, cash_flexibility, risk_level)
+    """
+    return (
+        new_cash / max(net_worth, 1),
+        new_cash - min_cash_reserve,
+        # Cash flexibility (ability to make future moves), higher above each threshold
+        CASH_FLEXIBILITY_VALUES[bisect_left(CASH_FLEXIBILITY_THRESHOLDS, new_cash)],
+        # Risk level, lower once cash reaches each threshold
+        CASH_RISK_VALUES[bisect_right(CASH_RISK_THRESHOLDS, new_cash)]
+    )
+
+
+def _trade_score_core(monopolies_completed: int, monopolies_broken: int,
+                      strategic_value: float, net_cash: int) -> float:
+    """
+    Scalar part of the trade offer scoring, kept free of game objects.
+    
+    Args:
+        monopolies_completed: Monopolies the offer completes for us
+        monopolies_broken: Monopolies the offer breaks for us
+        strategic_value: Net strategic value of the exchanged properties
+        net_cash: Money we receive minus money we pay
+        
+    Returns:
+        Trade offer score
+    """
+    return (0.0
+            + monopolies_completed * 100
+            - monopolies_broken * 80
+            + strategic_value / 10
+            + net_cash / 50)
+
+
+def _iter_sorted_lazily(scores: Dict, reverse: bool = False):
+    """
+    Yield the keys of a score dictionary ordered by score, one at a time.
+    
+    Equivalent to iterating sorted(scores, key=scores.get, reverse=reverse),
+    ties included, but only pays for the items actually consumed.
+    
+    Args:
+        scores: Dictionary mapping items to their scores
+        reverse: If True, yield the highest scores first
+        
+    Yields:
+        Keys of the dictionary in score order
+    """
+    sign = -1 if reverse else 1
+    heap = [(sign * score, index, key) for index, (key, score) in enumerate(scores.items())]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[2]
 
 
 class StrategicAgent(Player):
@@ -21,6 +99,18 @@ class StrategicAgent(Player):
     configurable parameters and game state analysis.
     """
     
+    # Agent state is read on every decision; subclasses without their own
+    # __slots__ still get a __dict__ for the attributes they add
+    __slots__ = (
+        "strategy_params",
+        "_property_values", "_property_group_completion", "_last_valuation_turn", "_current_turn",
+        "_cached_board", "_group_props", "_group_sizes", "_house_sale_values", "_hotel_sale_values",
+        "_board_soa", "_property_value_array",
+        "_opponent_monopolies",
+        "_owned_properties", "_my_monopoly_groups", "_owned_by_type",
+        "_rng"
+    )
+    
 
     def __init__(self, name: str, strategy_params: Optional[Dict] = None, can_be_referenced: bool = False):
         """
@@ -43,8 +133,40 @@ class StrategicAgent(Player):
         self._property_group_completion = {}
         self._last_valuation_turn = -1
         self._current_turn = 0
+        
+        # Per-board lookup tables, rebuilt only when the board changes
+        self._cached_board = None
+        self._group_props = {}
+        self._group_sizes = {}
+        self._house_sale_values = {}
+        self._hotel_sale_values = {}
+        self._board_soa = {}
+        self._property_value_array = None
+        
+        # Groups each opponent holds a monopoly on, refreshed per trade generation
+        self._opponent_monopolies = {}
+        
+        # Our own holdings and monopolies, refreshed per trade generation
+        self._owned_properties = frozenset()
+        self._my_monopoly_groups = frozenset()
+        self._owned_by_type = {}
+        
+        # Private generator for decision jitter, created on first use in each game
+        self._rng = None
             
 
+    def on_event_received(self, event):
+        """
+        Process game events, dropping the decision jitter generator when a game starts.
+        
+        The generator is reseeded from the global one on its next use, so seeding
+        a game fixes its trade decisions whatever games the agent played before.
+        """
+        super().on_event_received(event)
+        if event.type == EventType.GAME_STARTED:
+            self._rng = None
+
+
     def _get_default_params(self) -> Dict:
         """
         Default strategy parameters that define the agent's behavior.
@@ -100,6 +222,118 @@ class StrategicAgent(Player):
         }
     
 
+    def _refresh_board_cache(self, game_state: GameState) -> None:
+        """
+        Rebuild the per-board lookup tables when the agent sees a new board.
+        
+        Builds the group -> properties table and a structure-of-arrays
+        snapshot of the purchasable tiles, where each array is indexed by
+        tile id (board position) and holds 0 for non-purchasable tiles.
+        
+        Args:
+            game_state: Current game state
+        """
+        
+        # Tiles are compared by identity, so the tables are only valid for the same board
+        board = game_state.board
+        if self._cached_board is board:
+            return
+        
+        self._group_props = {
+            group: board.get_properties_by_group(group) for group in PropertyGroup
+        }
+        self._group_sizes = {group: len(properties) for group, properties in self._group_props.items()}
+        
+        # Cash raised by selling one house per property or one hotel in each group
+        self._house_sale_values = {group: group.house_cost() // 2 for group in PropertyGroup}
+        self._hotel_sale_values = {group: group.hotel_cost() // 2 for group in PropertyGroup}
+        
+        group_index = {group: i for i, group in enumerate(PropertyGroup)}
+        tile_count = len(board.tiles)
+        soa = {
+            "price": np.zeros(tile_count, dtype=np.int64),
+            "group_id": np.full(tile_count, -1, dtype=np.int64),
+            "mortgage": np.zeros(tile_count, dtype=np.int64),
+            "buyback": np.zeros(tile_count, dtype=np.int64)
+        }
+        for tile in board.tiles:
+            if isinstance(tile, (Property, Railway, Utility)):
+                soa["price"][tile.id] = tile.price
+                soa["mortgage"][tile.id] = tile.mortgage
+                soa["buyback"][tile.id] = tile.buyback_price
+            if tile.is_colored_property:
+                soa["group_id"][tile.id] = group_index[tile.group]
+        
+        self._board_soa = soa
+        self._property_value_array = np.zeros(tile_count)
+        self._cached_board = board
+        
+        # Valuations of the previous board are keyed by its tiles
+        self._property_values = {}
+    
+
+    def _get_group_properties(self, game_state: GameState) -> Dict[PropertyGroup, List[Property]]:
+        """
+        Get the properties of every group on the current board.
+        
+        Args:
+            game_state: Current game state
+            
+        Returns:
+            Dictionary mapping property groups to their properties
+        """
+        self._refresh_board_cache(game_state)
+        return self._group_props
+    
+
+    @staticmethod
+    def _tile_ids(tiles: List[Tile]) -> np.ndarray:
+        """
+        Get the tile ids of a list of tiles, for indexing the board arrays.
+        
+        Args:
+            tiles: Tiles to convert
+            
+        Returns:
+            Array of tile ids
+        """
+        return np.fromiter((tile.id for tile in tiles), dtype=np.int64, count=len(tiles))
+    
+
+    def _get_developed_groups(
+            self, game_state: GameState, player: Optional[Player] = None
+        ) -> List[Tuple[PropertyGroup, int, int]]:
+        """
+        Find the groups where we own houses or hotels, in one pass over the
+        development tables.
+        
+        Args:
+            game_state: Current game state
+            player: Player whose groups to find, this agent if None
+            
+        Returns:
+            List of (group, houses, hotels) tuples in property group order
+        """
+        if player is None:
+            player = self
+        houses_table = game_state.houses
+        hotels_table = game_state.hotels
+        developed = []
+        
+        for group in PropertyGroup:
+            # Skip if group doesn't exist in houses or hotels dictionaries
+            if group not in houses_table or group not in hotels_table:
+                continue
+            
+            houses, house_owner = houses_table[group]
+            hotels, hotel_owner = hotels_table[group]
+            
+            if (houses > 0 or hotels > 0) and (house_owner == player or hotel_owner == player):
+                developed.append((group, houses, hotels))
+        
+        return developed
+    
+
     def _update_turn_counter(self, game_state: GameState) -> None:
         """
         Update the internal turn counter based on the game state.
@@ -122,6 +356,7 @@ class StrategicAgent(Player):
         """
 
         # Check if we need to recalculate values (only do once per turn for efficiency)
+        self._refresh_board_cache(game_state)
         self._update_turn_counter(game_state)
         if self._current_turn == self._last_valuation_turn and self._property_values:
             return self._property_values
@@ -129,6 +364,10 @@ class StrategicAgent(Player):
         self._last_valuation_turn = self._current_turn
         values = {}
         
+        # Same values indexed by tile id, for array lookups
+        value_array = self._property_value_array
+        value_array.fill(0)
+        
         # Calculate group completion states
         self._property_group_completion = self._analyze_property_groups(game_state)
         
@@ -140,6 +379,9 @@ class StrategicAgent(Player):
                 values[tile] = self._calculate_railway_value(game_state, tile)
             elif isinstance(tile, Utility):
                 values[tile] = self._calculate_utility_value(game_state, tile)
+            else:
+                continue
+            value_array[tile.id] = values[tile]
         
         self._property_values = values
         return values
@@ -206,6 +448,9 @@ class StrategicAgent(Player):
         Returns:
             Calculated property value
         """
+        # Read once, this runs for every property on each valuation
+        params = self.strategy_params
+        
         # Base value starts with the property price
         base_value = property.price
         
@@ -221,10 +466,10 @@ class StrategicAgent(Player):
         # Apply multiplier based on how close we are to completing the monopoly
         completion_multiplier = 1.0
         if group_info["is_monopoly"]:
-            completion_multiplier = 1.0 + self.strategy_params["complete_set_bonus"]
+            completion_multiplier = 1.0 + params["complete_set_bonus"]
         elif group_info["can_complete"]:
             # Higher value if we can still complete this set
-            completion_multiplier = 1.0 + (self.strategy_params["complete_set_bonus"] * 
+            completion_multiplier = 1.0 + (params["complete_set_bonus"] * 
                                           group_info["completion_pct"])
         
         # Value location-based properties
@@ -232,22 +477,22 @@ class StrategicAgent(Player):
         
         # Orange and red properties (high chance of being landed on from jail)
         if property.group in [PropertyGroup.ORANGE, PropertyGroup.RED]:
-            location_multiplier *= self.strategy_params["orange_red_property_bonus"]
+            location_multiplier *= params["orange_red_property_bonus"]
         
         # Green and blue properties (high rents)
         elif property.group in [PropertyGroup.GREEN, PropertyGroup.BLUE]:
-            location_multiplier *= self.strategy_params["green_blue_property_bonus"]
+            location_multiplier *= params["green_blue_property_bonus"]
         
         # Properties 6-9 spaces after jail (high frequency)
         jail_position = game_state.board.get_jail_id()
         distance_from_jail = (property.id - jail_position) % 40
         if 6 <= distance_from_jail <= 9:
-            location_multiplier *= self.strategy_params["jail_adjacent_bonus"]
+            location_multiplier *= params["jail_adjacent_bonus"]
         
         # First property in a group discount/bonus
         if group_info["self_owned"] == 0:
-            early_game_factor = max(0, self.strategy_params["early_game_turns"] - self._current_turn) / self.strategy_params["early_game_turns"]
-            first_property_factor = self.strategy_params["first_property_eagerness"] * (1 + early_game_factor)
+            early_game_factor = max(0, params["early_game_turns"] - self._current_turn) / params["early_game_turns"]
+            first_property_factor = params["first_property_eagerness"] * (1 + early_game_factor)
             completion_multiplier *= first_property_factor
         
         # Calculate final value
@@ -338,21 +583,26 @@ class StrategicAgent(Player):
         return property_value / property.price
     
 
-    def _calculate_development_roi(self, game_state: GameState, group: PropertyGroup) -> float:
+    def _calculate_development_roi(
+            self, game_state: GameState, group: PropertyGroup, player: Optional[Player] = None
+        ) -> float:
         """
         Calculate the ROI for developing houses/hotels on a property group.
         
         Args:
             game_state: Current game state
             group: The property group to evaluate
+            player: Player developing the group, this agent if None
             
         Returns:
             ROI value (higher is better)
         """
+        if player is None:
+            player = self
         properties = game_state.board.get_properties_by_group(group)
         
         # Check if we own all properties in the group
-        if not all(prop in game_state.properties[self] for prop in properties):
+        if not all(prop in game_state.properties[player] for prop in properties):
             return 0
             
         # Check if any properties are mortgaged
@@ -597,9 +847,11 @@ class StrategicAgent(Player):
             return []
             
         # Sort groups by ROI (highest first)
-        sorted_groups = sorted(roi_by_group.keys(), key=lambda g: roi_by_group[g], reverse=True)
+        sorted_groups = sorted(roi_by_group.keys(), key=roi_by_group.__getitem__, reverse=True)
         
         remaining_cash = cash
+        min_cash_reserve = self.strategy_params["min_cash_reserve"]
+        hotel_roi_threshold = self.strategy_params["hotel_roi_threshold"]
         
         # Consider each group in order of ROI
         for group in sorted_groups:
@@ -617,7 +869,7 @@ class StrategicAgent(Player):
                 cost = group.house_cost() * len(properties)
                 
                 # Check if we can afford it and maintain minimum reserve
-                if remaining_cash - cost >= self.strategy_params["min_cash_reserve"]:
+                if remaining_cash - cost >= min_cash_reserve:
                     # Validate development
                     if not GameValidation.validate_place_house(game_state, self, group):
                         suggestions.append(group)
@@ -627,9 +879,9 @@ class StrategicAgent(Player):
                 cost = group.hotel_cost() * len(properties)
                 
                 # Check if we can afford it and maintain minimum reserve
-                if remaining_cash - cost >= self.strategy_params["min_cash_reserve"]:
+                if remaining_cash - cost >= min_cash_reserve:
                     # Check ROI threshold for hotel upgrades
-                    if roi_by_group[group] >= self.strategy_params["hotel_roi_threshold"]:
+                    if roi_by_group[group] >= hotel_roi_threshold:
                         # Validate development
                         if not GameValidation.validate_place_hotel(game_state, self, group):
                             suggestions.append(group)
@@ -643,8 +895,10 @@ class StrategicAgent(Player):
         emergency = cash < self.strategy_params["mortgage_emergency_threshold"]
         suggestions = []
         
+        min_cash_reserve = self.strategy_params["min_cash_reserve"]
+        
         # Don't mortgage unless in emergency or cash is very low
-        if not emergency and cash > self.strategy_params["min_cash_reserve"]:
+        if not emergency and cash > min_cash_reserve:
             return []
             
         # Get all properties we own that aren't mortgaged
@@ -682,8 +936,8 @@ class StrategicAgent(Player):
         if not property_roi:
             return []
             
-        # Sort properties by ROI (lowest first, as these are best to mortgage)
-        sorted_properties = sorted(property_roi.keys(), key=lambda p: property_roi[p])
+        # Order properties by ROI (lowest first, as these are best to mortgage)
+        sorted_properties = _iter_sorted_lazily(property_roi)
         
         # In emergency, mortgage more aggressively
         if emergency:
@@ -693,7 +947,7 @@ class StrategicAgent(Player):
                     suggestions.append(prop)
                     cash += prop.mortgage
                     # Stop once we have enough cash
-                    if cash >= self.strategy_params["min_cash_reserve"]:
+                    if cash >= min_cash_reserve:
                         break
         else:
             # Only mortgage properties with low ROI relative to average
@@ -707,7 +961,7 @@ class StrategicAgent(Player):
                         suggestions.append(prop)
                         cash += prop.mortgage
                         # Stop once we have enough cash
-                        if cash >= self.strategy_params["min_cash_reserve"]:
+                        if cash >= min_cash_reserve:
                             break
                             
         return suggestions
@@ -747,27 +1001,36 @@ class StrategicAgent(Player):
         if not property_roi:
             return []
             
-        # Sort properties by ROI (highest first, as these are best to unmortgage)
-        sorted_properties = sorted(property_roi.keys(), key=lambda p: property_roi[p], reverse=True)
+        # Order properties by ROI (highest first, as these are best to unmortgage)
+        sorted_properties = _iter_sorted_lazily(property_roi, reverse=True)
         
         remaining_cash = cash
+        roi_threshold = self.strategy_params["unmortgage_roi_threshold"]
+        min_cash_reserve = self.strategy_params["min_cash_reserve"]
         
         # Consider each property for unmortgaging
         for prop in sorted_properties:
-            # Check if ROI is above threshold
-            if property_roi[prop] >= self.strategy_params["unmortgage_roi_threshold"]:
-                # Check if we can afford it and maintain minimum reserve
-                if remaining_cash - prop.buyback_price >= self.strategy_params["min_cash_reserve"]:
-                    # Validate unmortgaging
-                    if not GameValidation.validate_unmortgage_property(game_state, self, prop):
-                        suggestions.append(prop)
-                        remaining_cash -= prop.buyback_price
+            # Check if ROI is above threshold, the remaining properties have lower ROI
+            if property_roi[prop] < roi_threshold:
+                break
+            
+            # Check if we can afford it and maintain minimum reserve
+            if remaining_cash - prop.buyback_price >= min_cash_reserve:
+                # Validate unmortgaging
+                if not GameValidation.validate_unmortgage_property(game_state, self, prop):
+                    suggestions.append(prop)
+                    remaining_cash -= prop.buyback_price
                         
         return suggestions
     
     
-    def get_downgrading_suggestions(self, game_state: GameState) -> List[PropertyGroup]:
-        cash = game_state.player_balances[self]
+    def get_downgrading_suggestions(
+            self, game_state: GameState, player: Optional[Player] = None
+        ) -> List[PropertyGroup]:
+        # Suggestions can be made for another player, applying this agent's strategy to their holdings
+        if player is None:
+            player = self
+        cash = game_state.player_balances[player]
         emergency = cash < self.strategy_params["mortgage_emergency_threshold"]
         
         # Don't downgrade unless in emergency or cash is very low
@@ -778,79 +1041,54 @@ class StrategicAgent(Player):
         
         # Calculate ROI for each property group with houses/hotels
         group_roi = {}
-        for group in PropertyGroup:
-            # Skip if group doesn't exist in houses or hotels dictionaries
-            if group not in game_state.houses or group not in game_state.hotels:
-                continue
-                
-            houses = game_state.houses[group][0]
-            hotels = game_state.hotels[group][0]
-            
-            # Skip if no development
-            if houses == 0 and hotels == 0:
-                continue
-                
-            # Skip if not owned by us
-            house_owner = game_state.houses[group][1]
-            hotel_owner = game_state.hotels[group][1]
-            if house_owner != self and hotel_owner != self:
-                continue
-                
+        for group, _, _ in self._get_developed_groups(game_state, player):
             # Calculate approximate ROI of current development
-            roi = self._calculate_development_roi(game_state, group)
+            roi = self._calculate_development_roi(game_state, group, player)
             group_roi[group] = roi
             
         # If no groups to downgrade
         if not group_roi:
             return []
             
-        # Sort groups by ROI (lowest first, as these are best to downgrade)
-        sorted_groups = sorted(group_roi.keys(), key=lambda g: group_roi[g])
+        # Order groups by ROI (lowest first, as these are best to downgrade)
+        sorted_groups = _iter_sorted_lazily(group_roi)
+        
+        # Cash raised by one sale in each group
+        self._refresh_board_cache(game_state)
+        hotel_sale_value = self._hotel_sale_values
+        house_sale_value = self._house_sale_values
         
-        # In emergency, downgrade more aggressively
+        # In emergency, downgrade more aggressively; otherwise only downgrade
+        # groups with low ROI relative to average
         if emergency:
-            for group in sorted_groups:
-                hotels = game_state.hotels[group][0]
-                houses = game_state.houses[group][0]
-                
-                # Validate downgrading
-                if hotels > 0 and game_state.hotels[group][1] == self:
-                    if not GameValidation.validate_sell_hotel(game_state, self, group):
-                        suggestions.append(group)
-                        # Stop once we have enough cash
-                        if cash + group.hotel_cost() // 2 >= self.strategy_params["min_cash_reserve"]:
-                            break
-                elif houses > 0 and game_state.houses[group][1] == self:
-                    if not GameValidation.validate_sell_house(game_state, self, group):
-                        suggestions.append(group)
-                        # Stop once we have enough cash
-                        if cash + group.house_cost() // 2 >= self.strategy_params["min_cash_reserve"]:
-                            break
+            accepted = set(group_roi)
         else:
-            # Only downgrade groups with low ROI relative to average
-            if group_roi:
-                avg_roi = sum(group_roi.values()) / len(group_roi)
-                threshold = avg_roi * self.strategy_params["mortgage_property_threshold"]
+            avg_roi = sum(group_roi.values()) / len(group_roi)
+            threshold = avg_roi * self.strategy_params["mortgage_property_threshold"]
+            accepted = {group for group, roi in group_roi.items() if roi <= threshold}
+            
+        min_cash_reserve = self.strategy_params["min_cash_reserve"]
+        for group in sorted_groups:
+            if group not in accepted:
+                continue
                 
-                for group in sorted_groups:
-                    if group_roi[group] <= threshold:
-                        hotels = game_state.hotels[group][0]
-                        houses = game_state.houses[group][0]
+            hotels = game_state.hotels[group][0]
+            houses = game_state.houses[group][0]
+            
+            # Validate downgrading
+            if hotels > 0 and game_state.hotels[group][1] == player:
+                if not GameValidation.validate_sell_hotel(game_state, player, group):
+                    suggestions.append(group)
+                    # Stop once we have enough cash
+                    if cash + hotel_sale_value[group] >= min_cash_reserve:
+                        break
+            elif houses > 0 and game_state.houses[group][1] == player:
+                if not GameValidation.validate_sell_house(game_state, player, group):
+                    suggestions.append(group)
+                    # Stop once we have enough cash
+                    if cash + house_sale_value[group] >= min_cash_reserve:
+                        break
                         
-                        # Validate downgrading
-                        if hotels > 0 and game_state.hotels[group][1] == self:
-                            if not GameValidation.validate_sell_hotel(game_state, self, group):
-                                suggestions.append(group)
-                                # Stop once we have enough cash
-                                if cash + group.hotel_cost() // 2 >= self.strategy_params["min_cash_reserve"]:
-                                    break
-                        elif houses > 0 and game_state.houses[group][1] == self:
-                            if not GameValidation.validate_sell_house(game_state, self, group):
-                                suggestions.append(group)
-                                # Stop once we have enough cash
-                                if cash + group.house_cost() // 2 >= self.strategy_params["min_cash_reserve"]:
-                                    break
-                                    
         return suggestions
     
     def should_pay_get_out_of_jail_fine(self, game_state: GameState) -> bool:
@@ -925,13 +1163,15 @@ class StrategicAgent(Player):
         
         # Calculate property values using existing method
         property_values = self._calculate_property_values(game_state)
+        group_props = self._get_group_properties(game_state)
+        opponents = [player for player in game_state.players if player != self]
         
         for prop in properties:
             if prop in property_values:
                 base_value = property_values[prop]
                 
                 # Add monopoly completion bonus
-                if isinstance(prop, Property):
+                if prop.is_colored_property:
                     group_info = self._property_group_completion[prop.group]
                     
                     # If this property would complete our monopoly
@@ -942,12 +1182,11 @@ class StrategicAgent(Player):
                     # (We need to check who owns it currently)
                     elif group_info["self_owned"] == 0:  # We don't own any in this group
                         # Check if opponent has monopoly
-                        for player in game_state.players:
-                            if player != self:
-                                opponent_group_props = game_state.board.get_properties_by_group(prop.group)
-                                if all(p in game_state.properties[player] for p in opponent_group_props):
-                                    base_value *= 1.8  # High value for breaking monopoly
-                                    break
+                        opponent_group_props = group_props[prop.group]
+                        for player in opponents:
+                            if all(p in game_state.properties[player] for p in opponent_group_props):
+                                base_value *= 1.8  # High value for breaking monopoly
+                                break
                 
                 total_value += base_value
         
@@ -974,30 +1213,32 @@ class StrategicAgent(Player):
             'strategic_value': 0.0
         }
         
-        # Check monopolies we would complete
-        for prop in properties_gained:
-            if isinstance(prop, Property):
-                group_properties = game_state.board.get_properties_by_group(prop.group)
-                current_owned = sum(1 for p in group_properties if p in game_state.properties[self])
-                
-                # If gaining this property completes monopoly
-                if current_owned == len(group_properties) - 1:
-                    impact['monopolies_completed'] += 1
-                    impact['strategic_value'] += 500  # High strategic value
-                else:
-                    # Progress toward monopoly
-                    progress = (current_owned + 1) / len(group_properties)
-                    impact['monopoly_progress'] += progress
-                    impact['strategic_value'] += progress * 200
+        self_properties = set(game_state.properties[self])
+        group_props = self._get_group_properties(game_state)
         
-        # Check monopolies we would break by losing properties
-        for prop in properties_lost:
-            if isinstance(prop, Property):
-                group_properties = game_state.board.get_properties_by_group(prop.group)
-                current_owned = sum(1 for p in group_properties if p in game_state.properties[self])
+        # Single pass over gained and lost properties
+        for properties, is_gained in ((properties_gained, True), (properties_lost, False)):
+            for prop in properties:
+                if not prop.is_colored_property:
+                    continue
+                
+                group_properties = group_props[prop.group]
+                group_size = len(group_properties)
+                current_owned = sum(1 for p in group_properties if p in self_properties)
+                
+                if is_gained:
+                    # If gaining this property completes monopoly
+                    if current_owned == group_size - 1:
+                        impact['monopolies_completed'] += 1
+                        impact['strategic_value'] += 500  # High strategic value
+                    else:
+                        # Progress toward monopoly
+                        progress = (current_owned + 1) / group_size
+                        impact['monopoly_progress'] += progress
+                        impact['strategic_value'] += progress * 200
                 
                 # If losing this property breaks our monopoly
-                if current_owned == len(group_properties):
+                elif current_owned == group_size:
                     impact['monopolies_broken'] += 1
                     impact['strategic_value'] -= 600  # Severe penalty for breaking monopoly
         
@@ -1015,37 +1256,17 @@ class StrategicAgent(Player):
         Returns:
             Dictionary with cash impact metrics
         """
-        current_cash = game_state.player_balances[self]
-        new_cash = current_cash + cash_change
+        new_cash = game_state.player_balances[self] + cash_change
+        liquidity_ratio, safety_margin, cash_flexibility, risk_level = _cash_impact_core(
+            new_cash, game_state.get_player_net_worth(self), self.strategy_params["min_cash_reserve"]
+        )
         
-        impact = {
-            'liquidity_ratio': new_cash / max(game_state.get_player_net_worth(self), 1),
-            'safety_margin': new_cash - self.strategy_params["min_cash_reserve"],
-            'cash_flexibility': 0.0,
-            'risk_level': 0.0
+        return {
+            'liquidity_ratio': liquidity_ratio,
+            'safety_margin': safety_margin,
+            'cash_flexibility': cash_flexibility,
+            'risk_level': risk_level
         }
-        
-        # Calculate cash flexibility (ability to make future moves)
-        if new_cash > 800:
-            impact['cash_flexibility'] = 1.0  # High flexibility
-        elif new_cash > 500:
-            impact['cash_flexibility'] = 0.7  # Good flexibility
-        elif new_cash > 300:
-            impact['cash_flexibility'] = 0.4  # Limited flexibility
-        else:
-            impact['cash_flexibility'] = 0.1  # Very limited
-        
-        # Calculate risk level
-        if new_cash < 100:
-            impact['risk_level'] = 1.0  # Very high risk
-        elif new_cash < 200:
-            impact['risk_level'] = 0.8  # High risk
-        elif new_cash < 400:
-            impact['risk_level'] = 0.5  # Moderate risk
-        else:
-            impact['risk_level'] = 0.2  # Low risk
-        
-        return impact
 
 
     def should_accept_trade_offer(self, game_state: GameState, trade_offer: TradeOffer) -> bool:
@@ -1065,35 +1286,44 @@ class StrategicAgent(Player):
         current_cash = game_state.player_balances[self]
         
         # CRITICAL FILTERS - Auto-reject trades that are obviously bad
+        # (ordered from cheapest to most expensive check)
         
         # 1. Don't accept trades that would leave us with dangerously low cash
         if current_cash + net_cash_change < self.strategy_params["min_cash_reserve"]:
             return False
         
-        # 2. Don't accept trades where money offered exceeds reasonable property value
-        total_property_value = sum(prop.price for prop in properties_gained)
-        if money_gained > total_property_value * 1.5:  # More than 1.5x property value is suspicious
+        # 2. Don't accept trades that would consume more than 70% of our cash
+        if money_lost > current_cash * 0.7:
             return False
         
         # 3. Don't accept trades where we pay more than 2x property value
-        if money_lost > sum(prop.price for prop in properties_lost) * 2.0:
+        total_price_lost = sum(prop.price for prop in properties_lost)
+        if money_lost > total_price_lost * 2.0:
             return False
         
-        # 4. Don't accept trades that would consume more than 70% of our cash
-        if money_lost > current_cash * 0.7:
+        # 4. Don't accept trades where money offered exceeds reasonable property value
+        total_price_gained = sum(prop.price for prop in properties_gained)
+        if money_gained > total_price_gained * 1.5:  # More than 1.5x property value is suspicious
             return False
         
         # 5. Don't break our own monopolies unless compensation is extraordinary
-        for prop in properties_lost:
-            if isinstance(prop, Property):
-                group_properties = game_state.board.get_properties_by_group(prop.group)
-                if all(p in game_state.properties[self] for p in group_properties):
-                    # We're breaking our monopoly - need 3x property value in compensation
-                    compensation_needed = prop.price * 3
-                    total_compensation = self._calculate_trade_value(game_state, properties_gained, 
-                                                                money_gained, jail_cards_gained)
-                    if total_compensation < compensation_needed:
-                        return False
+        self_properties = set(game_state.properties[self])
+        group_props = self._get_group_properties(game_state)
+        monopoly_prices = [
+            prop.price for prop in properties_lost
+            if prop.is_colored_property and 
+            all(p in self_properties for p in group_props[prop.group])
+        ]
+        
+        # Value of what we gain, computed at most once for the filter and the analysis
+        value_gained = None
+        if monopoly_prices:
+            # We're breaking our monopoly - need 3x property value in compensation
+            compensation_needed = max(monopoly_prices) * 3
+            value_gained = self._calculate_trade_value(game_state, properties_gained, 
+                                                       money_gained, jail_cards_gained)
+            if value_gained < compensation_needed:
+                return False
         
         # COMPREHENSIVE STRATEGIC ANALYSIS
         
@@ -1104,7 +1334,8 @@ class StrategicAgent(Player):
         cash_impact = self._evaluate_cash_impact(game_state, net_cash_change)
         
         # Calculate trade values
-        value_gained = self._calculate_trade_value(game_state, properties_gained, money_gained, jail_cards_gained)
+        if value_gained is None:
+            value_gained = self._calculate_trade_value(game_state, properties_gained, money_gained, jail_cards_gained)
         value_lost = self._calculate_trade_value(game_state, properties_lost, money_lost, jail_cards_lost)
         
         # DECISION MATRIX - Weight different factors
@@ -1154,14 +1385,16 @@ class StrategicAgent(Player):
         
         # FINAL DECISION
         # Also consider random factor for variety (small influence)
-        randomness = (random.random() - 0.5) * 0.05
+        if self._rng is None:
+            # Seeded from the global generator on first use, so seeding the game still applies
+            self._rng = random.Random(random.getrandbits(64))
+        randomness = (self._rng.random() - 0.5) * 0.05
         final_score = decision_score + randomness
         
         return final_score > 0.1  # Require positive score with buffer
 
 
     def get_trade_offers(self, game_state: GameState) -> List[TradeOffer]:
-        trade_offers = []
         current_cash = game_state.player_balances[self]
         
         # Don't make trades if we're in a precarious financial situation
@@ -1169,6 +1402,24 @@ class StrategicAgent(Player):
             return []
         
         property_values = self._calculate_property_values(game_state)
+        self._update_own_holdings(game_state)
+        self._update_opponent_monopolies(game_state)
+        
+        # Score offers as they are generated and keep only the best ones
+        scored_trades = (
+            (offer, self._score_trade_offer(game_state, offer))
+            for offer in self._generate_unique_trade_offers(game_state, property_values, current_cash)
+        )
+        
+        # Return top 3 trades (highest score first) to avoid overwhelming opponents
+        top_trades = heapq.nlargest(3, scored_trades, key=itemgetter(1))
+        return [trade for trade, score in top_trades if score > 0]
+
+
+    def _generate_unique_trade_offers(self, game_state: GameState, property_values: Dict, 
+                                      current_cash: int) -> Iterator[TradeOffer]:
+        """Generate candidate trades against every opponent, skipping duplicate offers."""
+        seen = set()
         
         # For each opponent, analyze potential trades
         for opponent in game_state.players:
@@ -1179,58 +1430,91 @@ class StrategicAgent(Player):
             if opponent_cash < 100:  # Skip broke opponents
                 continue
             
-            # STRATEGY 1: Monopoly Completion Trades
-            monopoly_trades = self._generate_monopoly_completion_trades(
-                game_state, opponent, property_values, opponent_cash
-            )
-            trade_offers.extend(monopoly_trades)
-            
-            # STRATEGY 2: Monopoly Breaking Trades
-            breaking_trades = self._generate_monopoly_breaking_trades(
-                game_state, opponent, property_values, opponent_cash
-            )
-            trade_offers.extend(breaking_trades)
-            
-            # STRATEGY 3: Value Optimization Trades
-            value_trades = self._generate_value_optimization_trades(
-                game_state, opponent, property_values, opponent_cash
-            )
-            trade_offers.extend(value_trades)
+            strategies = [
+                # STRATEGY 1: Monopoly Completion Trades
+                self._generate_monopoly_completion_trades(game_state, opponent, property_values, opponent_cash),
+                # STRATEGY 2: Monopoly Breaking Trades
+                self._generate_monopoly_breaking_trades(game_state, opponent, property_values, opponent_cash),
+                # STRATEGY 3: Value Optimization Trades
+                self._generate_value_optimization_trades(game_state, opponent, property_values, opponent_cash)
+            ]
             
             # STRATEGY 4: Cash Generation Trades
             if current_cash < 600:  # We need cash
-                cash_trades = self._generate_cash_generation_trades(
-                    game_state, opponent, property_values, opponent_cash
+                strategies.append(
+                    self._generate_cash_generation_trades(game_state, opponent, property_values, opponent_cash)
                 )
-                trade_offers.extend(cash_trades)
-        
-        # Sort trades by strategic value and return top ones
-        if trade_offers:
-            scored_trades = []
-            for offer in trade_offers:
-                score = self._score_trade_offer(game_state, offer)
-                scored_trades.append((offer, score))
             
-            # Sort by score (highest first)
-            scored_trades.sort(key=lambda x: x[1], reverse=True)
-            
-            # Return top 3 trades to avoid overwhelming opponents
-            return [trade for trade, score in scored_trades[:3] if score > 0]
+            for trade in chain.from_iterable(strategies):
+                key = (
+                    trade.target_player,
+                    frozenset(trade.properties_offered), trade.money_offered, trade.jail_cards_offered,
+                    frozenset(trade.properties_requested), trade.money_requested, trade.jail_cards_requested
+                )
+                if key not in seen:
+                    seen.add(key)
+                    yield trade
+
+
+    def _update_own_holdings(self, game_state: GameState) -> None:
+        """
+        Record the properties we own, bucketed by tile type, and the groups
+        we hold a monopoly on.
+        
+        Args:
+            game_state: Current game state
+        """
+        group_props = self._get_group_properties(game_state)
+        owned = frozenset(game_state.properties[self])
+        
+        self._owned_properties = owned
+        
+        # Buckets keep the order of our property list
+        owned_by_type = defaultdict(list)
+        for prop in game_state.properties[self]:
+            owned_by_type[type(prop)].append(prop)
+        self._owned_by_type = owned_by_type
+        
+        self._my_monopoly_groups = frozenset(
+            group for group, properties in group_props.items()
+            if all(p in owned for p in properties)
+        )
+
+
+    def _update_opponent_monopolies(self, game_state: GameState) -> None:
+        """
+        Record the groups every opponent currently holds a monopoly on.
         
-        return []
+        Groups are kept in board order so trade generation stays deterministic.
+        
+        Args:
+            game_state: Current game state
+        """
+        group_props = self._get_group_properties(game_state)
+        self._opponent_monopolies = {}
+        
+        for player in game_state.players:
+            if player == self:
+                continue
+            
+            owned = set(game_state.properties[player])
+            self._opponent_monopolies[player] = tuple(
+                group for group, properties in group_props.items()
+                if all(p in owned for p in properties)
+            )
 
 
     def _generate_monopoly_completion_trades(self, game_state: GameState, opponent, 
-                                        property_values: Dict, opponent_cash: int) -> List[TradeOffer]:
+                                        property_values: Dict, opponent_cash: int) -> Iterator[TradeOffer]:
         """Generate trades focused on completing monopolies."""
-        trades = []
-        
+        group_props = self._get_group_properties(game_state)
+        owned = self._owned_properties
         for group, info in self._property_group_completion.items():
             if info["can_complete"] and info["remaining_needed"] == 1:
                 # Find the missing property
-                group_properties = game_state.board.get_properties_by_group(group)
+                group_properties = group_props[group]
                 missing_properties = [p for p in group_properties 
-                                    if p not in game_state.properties[self]]
+                                    if p not in owned]
                 
                 for missing_prop in missing_properties:
                     if missing_prop in game_state.properties[opponent]:
@@ -1239,47 +1523,35 @@ class StrategicAgent(Player):
                             game_state, opponent, missing_prop, property_values, opponent_cash
                         )
                         if trade:
-                            trades.append(trade)
-        
-        return trades
+                            yield trade
 
 
     def _generate_monopoly_breaking_trades(self, game_state: GameState, opponent,
-                                        property_values: Dict, opponent_cash: int) -> List[TradeOffer]:
+                                        property_values: Dict, opponent_cash: int) -> Iterator[TradeOffer]:
         """Generate trades focused on breaking opponent monopolies."""
-        trades = []
-        
-        # Check opponent's monopolies
-        for group in PropertyGroup:
-            group_properties = game_state.board.get_properties_by_group(group)
-            if all(p in game_state.properties[opponent] for p in group_properties):
-                # Opponent has monopoly - try to break it by acquiring one property
-                for prop in group_properties:
-                    if prop.price <= self.strategy_params["min_cash_reserve"] * 2:
-                        # Try to buy this property to break monopoly
-                        trade = self._create_monopoly_breaking_trade(
-                            game_state, opponent, prop, property_values, opponent_cash
-                        )
-                        if trade:
-                            trades.append(trade)
-                            break  # Only need to break one property per monopoly
-        
-        return trades
+        # Opponent has monopoly - try to break it by acquiring one property
+        group_props = self._get_group_properties(game_state)
+        for group in self._opponent_monopolies.get(opponent, ()):
+            for prop in group_props[group]:
+                if prop.price <= self.strategy_params["min_cash_reserve"] * 2:
+                    # Try to buy this property to break monopoly
+                    trade = self._create_monopoly_breaking_trade(
+                        game_state, opponent, prop, property_values, opponent_cash
+                    )
+                    if trade:
+                        yield trade
+                        break  # Only need to break one property per monopoly
 
 
     def _generate_value_optimization_trades(self, game_state: GameState, opponent,
-                                        property_values: Dict, opponent_cash: int) -> List[TradeOffer]:
+                                        property_values: Dict, opponent_cash: int) -> Iterator[TradeOffer]:
         """Generate trades focused on optimizing property values."""
-        trades = []
-        
         # Find undervalued properties we can acquire
         for prop in game_state.properties[opponent]:
             if isinstance(prop, (Property, Railway, Utility)):
                 # Skip if property is part of opponent's monopoly
-                if isinstance(prop, Property):
-                    group_properties = game_state.board.get_properties_by_group(prop.group)
-                    if all(p in game_state.properties[opponent] for p in group_properties):
-                        continue  # Don't try to break monopolies here (handled separately)
+                if prop.is_colored_property and prop.group in self._opponent_monopolies.get(opponent, ()):
+                    continue  # Don't try to break monopolies here (handled separately)
                 
                 our_value = property_values.get(prop, prop.price)
                 fair_price = prop.price * 1.1  # 10% premium for negotiation
@@ -1290,24 +1562,19 @@ class StrategicAgent(Player):
                         game_state, opponent, prop, property_values, opponent_cash
                     )
                     if trade:
-                        trades.append(trade)
-        
-        return trades
+                        yield trade
 
 
     def _generate_cash_generation_trades(self, game_state: GameState, opponent,
-                                    property_values: Dict, opponent_cash: int) -> List[TradeOffer]:
+                                    property_values: Dict, opponent_cash: int) -> Iterator[TradeOffer]:
         """Generate trades focused on raising cash."""
-        trades = []
-        
         # Find properties we can sell for good value
+        cash_cap = opponent_cash // 2  # Don't take all their cash
         for prop in game_state.properties[self]:
             if isinstance(prop, (Property, Railway, Utility)):
                 # Don't sell monopoly properties
-                if isinstance(prop, Property):
-                    group_properties = game_state.board.get_properties_by_group(prop.group)
-                    if all(p in game_state.properties[self] for p in group_properties):
-                        continue
+                if prop.is_colored_property and prop.group in self._my_monopoly_groups:
+                    continue
                 
                 # Only sell if we can get good value
                 min_price = prop.price * 1.2  # At least 20% premium
@@ -1319,31 +1586,31 @@ class StrategicAgent(Player):
                         money_offered=0,
                         jail_cards_offered=0,
                         properties_requested=[prop],
-                        money_requested=min(min_price, opponent_cash // 2),  # Don't take all their cash
+                        money_requested=min(min_price, cash_cap),
                         jail_cards_requested=0
                     )
                     
-                    if not GameValidation.validate_trade_offer(game_state, trade):
-                        trades.append(trade)
-        
-        return trades
+                    if self._quick_trade_feasible(game_state, trade) and not GameValidation.validate_trade_offer(game_state, trade):
+                        yield trade
 
 
     def _create_monopoly_completion_trade(self, game_state: GameState, opponent,
                                         target_property: Property, property_values: Dict, 
                                         opponent_cash: int) -> Optional[TradeOffer]:
         """Create a trade offer to complete a monopoly."""
+        price = target_property.price
+        
         # Calculate how much we're willing to pay
-        monopoly_value = property_values.get(target_property, target_property.price) * 2.5
+        monopoly_value = property_values.get(target_property, price) * 2.5
         max_offer = min(monopoly_value, opponent_cash // 2, game_state.player_balances[self] // 3)
         
-        if max_offer < target_property.price:
+        if max_offer < price:
             return None
         
         # Try different trade combinations
         
         # Option 1: Cash only
-        cash_offer = min(target_property.price * 1.3, max_offer)
+        cash_offer = min(price * 1.3, max_offer)
         if cash_offer <= opponent_cash // 3:  # Don't take too much of their cash
             trade = TradeOffer(
                 source_player=self,
@@ -1356,14 +1623,15 @@ class StrategicAgent(Player):
                 jail_cards_requested=0
             )
             
-            if not GameValidation.validate_trade_offer(game_state, trade):
+            if self._quick_trade_feasible(game_state, trade) and not GameValidation.validate_trade_offer(game_state, trade):
                 return trade
         
         # Option 2: Property + Cash
         suitable_properties = self._find_suitable_trade_properties(game_state, opponent, target_property)
         if suitable_properties:
             offered_property = suitable_properties[0]
-            cash_difference = max(0, target_property.price - offered_property.price)
+            price_gap = price - offered_property.price
+            cash_difference = price_gap if price_gap > 0 else 0
             
             if cash_difference <= max_offer:
                 trade = TradeOffer(
@@ -1377,7 +1645,7 @@ class StrategicAgent(Player):
                     jail_cards_requested=0
                 )
                 
-                if not GameValidation.validate_trade_offer(game_state, trade):
+                if self._quick_trade_feasible(game_state, trade) and not GameValidation.validate_trade_offer(game_state, trade):
                     return trade
         
         return None
@@ -1387,11 +1655,14 @@ class StrategicAgent(Player):
                                     target_property: Property, property_values: Dict,
                                     opponent_cash: int) -> Optional[TradeOffer]:
         """Create a trade offer to break opponent's monopoly."""
+        price = target_property.price
+        
         # Calculate premium for breaking monopoly
-        break_value = target_property.price * 2.0  # High premium
-        max_offer = min(break_value, game_state.player_balances[self] // 4)
+        break_value = price * 2.0  # High premium
+        balance_quarter = game_state.player_balances[self] // 4
+        max_offer = break_value if break_value <= balance_quarter else balance_quarter
         
-        if max_offer < target_property.price * 1.5:
+        if max_offer < price * 1.5:
             return None
         
         trade = TradeOffer(
@@ -1405,7 +1676,7 @@ class StrategicAgent(Player):
             jail_cards_requested=0
         )
         
-        if not GameValidation.validate_trade_offer(game_state, trade):
+        if self._quick_trade_feasible(game_state, trade) and not GameValidation.validate_trade_offer(game_state, trade):
             return trade
         
         return None
@@ -1414,8 +1685,10 @@ class StrategicAgent(Player):
     def _create_value_trade(self, game_state: GameState, opponent, target_property,
                         property_values: Dict, opponent_cash: int) -> Optional[TradeOffer]:
         """Create a value-based trade offer."""
-        our_value = property_values.get(target_property, target_property.price)
-        fair_offer = min(our_value, target_property.price * 1.2)
+        price = target_property.price
+        our_value = property_values.get(target_property, price)
+        price_cap = price * 1.2
+        fair_offer = our_value if our_value <= price_cap else price_cap
         
         if fair_offer > game_state.player_balances[self] // 4:
             return None
@@ -1431,31 +1704,56 @@ class StrategicAgent(Player):
             jail_cards_requested=0
         )
         
-        if not GameValidation.validate_trade_offer(game_state, trade):
+        if self._quick_trade_feasible(game_state, trade) and not GameValidation.validate_trade_offer(game_state, trade):
             return trade
         
         return None
 
 
+    def _quick_trade_feasible(self, game_state: GameState, trade: TradeOffer) -> bool:
+        """
+        Cheaply reject generated trades the full validation would reject.
+        
+        Only checks the conditions generated trades commonly fail: money the
+        other side does not have and mortgaged properties. Passing this check
+        does not make a trade valid.
+        
+        Args:
+            game_state: Current game state
+            trade: The generated trade offer
+            
+        Returns:
+            False if the trade is certainly invalid, True otherwise
+        """
+        balances = game_state.player_balances
+        if trade.money_requested and trade.money_requested > balances[trade.target_player]:
+            return False
+        if trade.money_offered and trade.money_offered > balances[trade.source_player]:
+            return False
+        
+        mortgaged = game_state.mortgaged_properties
+        return not any(p in mortgaged for p in chain(trade.properties_requested, trade.properties_offered))
+
+
     def _find_suitable_trade_properties(self, game_state: GameState, opponent, 
                                     target_property) -> List[Property]:
         """Find properties suitable for trading."""
-        suitable = []
-        
-        for prop in game_state.properties[self]:
-            if isinstance(prop, type(target_property)):
-                # Don't trade monopoly properties
-                if isinstance(prop, Property):
-                    group_properties = game_state.board.get_properties_by_group(prop.group)
-                    if all(p in game_state.properties[self] for p in group_properties):
-                        continue
-                
-                # Property should be of similar or lesser value
-                if prop.price <= target_property.price * 1.2:
-                    suitable.append(prop)
+        max_price = target_property.price * 1.2
+        candidates = self._owned_by_type.get(type(target_property), ())
+        
+        # The bucket holds a single tile type, so only colored properties
+        # need the monopoly check
+        if target_property.is_colored_property:
+            # Don't trade monopoly properties
+            monopoly_groups = self._my_monopoly_groups
+            suitable = [prop for prop in candidates
+                        if prop.group not in monopoly_groups and prop.price <= max_price]
+        else:
+            # Property should be of similar or lesser value
+            suitable = [prop for prop in candidates if prop.price <= max_price]
         
         # Sort by strategic value (lower first - we prefer to trade less valuable properties)
-        suitable.sort(key=lambda p: p.price)
+        suitable.sort(key=attrgetter("price"))
         return suitable
 
 
@@ -1468,13 +1766,12 @@ class StrategicAgent(Player):
         
         monopoly_impact = self._calculate_monopoly_impact(game_state, properties_gained, properties_lost)
         
-        score = 0.0
-        score += monopoly_impact['monopolies_completed'] * 100
-        score -= monopoly_impact['monopolies_broken'] * 80
-        score += monopoly_impact['strategic_value'] / 10
-        score += net_cash / 50
-        
-        return score
+        return _trade_score_core(
+            monopoly_impact['monopolies_completed'],
+            monopoly_impact['monopolies_broken'],
+            monopoly_impact['strategic_value'],
+            net_cash
+        )
     
 
     def handle_bankruptcy(self, game_state: GameState, amount: int) -> BankruptcyRequest:
@@ -1485,6 +1782,13 @@ class StrategicAgent(Player):
         if needed <= 0:
             return BankruptcyRequest([], [], [])
         
+        # Upper bound: mortgage everything unmortgaged and downgrade every developed group
+        unmortgaged = [p for p in game_state.properties[self] if p not in game_state.mortgaged_properties]
+        developed = [group for group, _, _ in self._get_developed_groups(game_state)]
+        if self._calculate_bankruptcy_funds(game_state, unmortgaged, developed) < needed:
+            # Cannot avoid bankruptcy whatever we liquidate
+            return BankruptcyRequest([], [], [])
+        
         # Initialize request
         downgrading_suggestions = []
         mortgaging_suggestions = []
@@ -1492,65 +1796,65 @@ class StrategicAgent(Player):
         # Order of liquidation depends on strategy params
         if self.strategy_params["bankruptcy_mortgage_first"]:
             # Try mortgaging first
-            self._handle_bankruptcy_mortgaging(game_state, needed, mortgaging_suggestions)
+            can_raise = self._handle_bankruptcy_mortgaging(game_state, needed, mortgaging_suggestions)
             
             # If still not enough, try selling houses/hotels
-            if self._calculate_bankruptcy_funds(game_state, BankruptcyRequest([], mortgaging_suggestions, [])) < needed:
-                self._handle_bankruptcy_downgrading(game_state, needed, downgrading_suggestions)
+            if can_raise < needed:
+                can_raise += self._handle_bankruptcy_downgrading(game_state, needed, downgrading_suggestions)
                 
             # If still not enough, try trades (not implemented for simplicity)
         else:
             # Try selling houses/hotels first
-            self._handle_bankruptcy_downgrading(game_state, needed, downgrading_suggestions)
+            can_raise = self._handle_bankruptcy_downgrading(game_state, needed, downgrading_suggestions)
             
             # If still not enough, try mortgaging
-            if self._calculate_bankruptcy_funds(game_state, BankruptcyRequest(downgrading_suggestions, [], [])) < needed:
-                self._handle_bankruptcy_mortgaging(game_state, needed, mortgaging_suggestions)
+            if can_raise < needed:
+                can_raise += self._handle_bankruptcy_mortgaging(game_state, needed, mortgaging_suggestions)
                 
             # If still not enough, try trades (not implemented for simplicity)
         
         # Check if we can avoid bankruptcy
-        bankruptcy_request = BankruptcyRequest(downgrading_suggestions, mortgaging_suggestions, [])
-        can_raise = self._calculate_bankruptcy_funds(game_state, bankruptcy_request)
-        
         if can_raise < needed:
             # Cannot avoid bankruptcy, return empty request to signal bankruptcy
             return BankruptcyRequest([], [], [])
             
-        return bankruptcy_request
+        return BankruptcyRequest(downgrading_suggestions, mortgaging_suggestions, [])
     
 
-    def _calculate_bankruptcy_funds(self, game_state: GameState, bankruptcy_request: BankruptcyRequest) -> int:
+    def _calculate_bankruptcy_funds(self, game_state: GameState, mortgaging: Sequence[Tile] = (),
+                                    downgrading: Sequence[PropertyGroup] = ()) -> int:
         """
-        Calculate how much money would be raised from a bankruptcy request.
+        Calculate how much money would be raised by mortgaging and downgrading.
         
         Args:
             game_state: Current game state
-            bankruptcy_request: The bankruptcy request to evaluate
+            mortgaging: Properties that would be mortgaged
+            downgrading: Property groups that would be downgraded
             
         Returns:
             The amount of money that would be raised
         """
-        funds = 0
+        self._refresh_board_cache(game_state)
         
         # Money from mortgaging
-        for prop in bankruptcy_request.mortgaging_suggestions:
-            funds += prop.mortgage
+        mortgaged_ids = self._tile_ids(mortgaging)
+        funds = int(self._board_soa["mortgage"][mortgaged_ids].sum())
             
         # Money from selling houses/hotels
-        for group in bankruptcy_request.downgrading_suggestions:
-            if group in game_state.hotels and game_state.hotels[group][0] > 0 and game_state.hotels[group][1] == self:
-                funds += group.hotel_cost() // 2
-            elif group in game_state.houses and game_state.houses[group][0] > 0 and game_state.houses[group][1] == self:
-                num_properties = len(game_state.board.get_properties_by_group(group))
-                funds += (group.house_cost() // 2) * num_properties
+        for group in downgrading:
+            hotel_count, hotel_owner = game_state.hotels.get(group, (0, None))
+            house_count, house_owner = game_state.houses.get(group, (0, None))
+            if hotel_count > 0 and hotel_owner == self:
+                funds += self._hotel_sale_values[group]
+            elif house_count > 0 and house_owner == self:
+                funds += self._house_sale_values[group] * self._group_sizes[group]
                 
         # Money from trades (not implemented for simplicity)
         
         return funds
     
     
-    def _handle_bankruptcy_mortgaging(self, game_state: GameState, needed: int, mortgage_suggestions: List[Tile]) -> None:
+    def _handle_bankruptcy_mortgaging(self, game_state: GameState, needed: int, mortgage_suggestions: List[Tile]) -> int:
         """
         Handle bankruptcy by suggesting properties to mortgage.
         
@@ -1558,35 +1862,38 @@ class StrategicAgent(Player):
             game_state: Current game state
             needed: The amount needed
             mortgage_suggestions: List to append mortgage suggestions to
+            
+        Returns:
+            The amount of money the appended suggestions would raise
         """
-        property_values = self._calculate_property_values(game_state)
+        # Refreshes the tile id indexed values used below
+        self._calculate_property_values(game_state)
         funds_raised = 0
         
-        # Get all unmortgaged properties
-        properties = [p for p in game_state.properties[self] if p not in game_state.mortgaged_properties]
+        # Groups with houses/hotels, looked up once instead of per property
+        mortgaged = game_state.mortgaged_properties
+        developed_groups = {group for group, (count, _) in game_state.houses.items() if count > 0}
+        developed_groups.update(group for group, (count, _) in game_state.hotels.items() if count > 0)
         
-        # Filter out properties with houses/hotels
-        properties = [p for p in properties if not (
-            isinstance(p, Property) and 
-            (p.group in game_state.houses and game_state.houses[p.group][0] > 0 or 
-             p.group in game_state.hotels and game_state.hotels[p.group][0] > 0)
+        # Get all unmortgaged properties, without houses/hotels
+        properties = [p for p in game_state.properties[self] if p not in mortgaged and not (
+            p.is_colored_property and p.group in developed_groups
         )]
         
-        # Sort properties by strategic value (lowest first)
-        def property_priority(prop):
-            value = property_values.get(prop, prop.price)
-            
-            # Adjust for group completion
-            if isinstance(prop, Property):
-                group_info = self._property_group_completion[prop.group]
-                if group_info["is_monopoly"]:
-                    # Avoid mortgaging monopolies
-                    value *= self.strategy_params["bankruptcy_group_completion_weight"]
-                    
-            # Normalize by mortgage value
-            return value / prop.mortgage if prop.mortgage > 0 else float('inf')
-            
-        sorted_properties = sorted(properties, key=property_priority)
+        # Sort properties by strategic value per mortgage dollar (lowest first)
+        ids = self._tile_ids(properties)
+        values = self._property_value_array[ids]
+        
+        # Avoid mortgaging monopolies
+        monopoly_ids = [i for i, group in enumerate(PropertyGroup)
+                        if self._property_group_completion[group]["is_monopoly"]]
+        in_monopoly = np.isin(self._board_soa["group_id"][ids], monopoly_ids)
+        values = np.where(in_monopoly, values * self.strategy_params["bankruptcy_group_completion_weight"], values)
+        
+        # Normalize by mortgage value
+        mortgages = self._board_soa["mortgage"][ids]
+        priorities = np.divide(values, mortgages, out=np.full(len(ids), np.inf), where=mortgages > 0)
+        sorted_properties = [properties[i] for i in np.argsort(priorities, kind="stable")]
         
         # Add properties to mortgage suggestions
         for prop in sorted_properties:
@@ -1598,9 +1905,11 @@ class StrategicAgent(Player):
                 # Stop if we've raised enough funds
                 if funds_raised >= needed:
                     break
+        
+        return funds_raised
     
 
-    def _handle_bankruptcy_downgrading(self, game_state: GameState, needed: int, downgrade_suggestions: List[PropertyGroup]) -> None:
+    def _handle_bankruptcy_downgrading(self, game_state: GameState, needed: int, downgrade_suggestions: List[PropertyGroup]) -> int:
         """
         Handle bankruptcy by suggesting properties to downgrade (sell houses/hotels).
         
@@ -1608,56 +1917,59 @@ class StrategicAgent(Player):
             game_state: Current game state
             needed: The amount needed
             downgrade_suggestions: List to append downgrade suggestions to
+            
+        Returns:
+            The amount of money the appended suggestions would raise
         """
         funds_raised = 0
-        property_values = self._calculate_property_values(game_state)
+        
+        # Refreshes the tile id indexed values used below
+        self._calculate_property_values(game_state)
         
         # Get all groups with development
         groups_with_development = []
+        group_props = self._get_group_properties(game_state)
         
-        for group in PropertyGroup:
-            if group not in game_state.houses or group not in game_state.hotels:
-                continue
-                
-            houses = game_state.houses[group][0]
-            hotels = game_state.hotels[group][0]
+        for group, houses, hotels in self._get_developed_groups(game_state):
+            # Calculate value per development
+            group_properties = group_props[group]
+            total_value = self._property_value_array[self._tile_ids(group_properties)].sum()
             
-            if (houses > 0 or hotels > 0) and (game_state.houses[group][1] == self or game_state.hotels[group][1] == self):
-                # Calculate value per development
-                group_properties = game_state.board.get_properties_by_group(group)
-                total_value = sum(property_values.get(prop, prop.price) for prop in group_properties)
-                
-                # Calculate money that would be raised by selling
-                money_raised = 0
-                if hotels > 0 and game_state.hotels[group][1] == self:
-                    money_raised = group.hotel_cost() // 2
-                elif houses > 0 and game_state.houses[group][1] == self:
-                    money_raised = (group.house_cost() // 2) * len(group_properties)
-                
-                # Calculate ratio of value to money raised
-                value_ratio = total_value / money_raised if money_raised > 0 else float('inf')
-                
-                groups_with_development.append((group, value_ratio))
+            # Calculate money that would be raised by selling
+            money_raised = 0
+            if hotels > 0 and game_state.hotels[group][1] == self:
+                money_raised = self._hotel_sale_values[group]
+            elif houses > 0 and game_state.houses[group][1] == self:
+                money_raised = self._house_sale_values[group] * self._group_sizes[group]
+            
+            # Calculate ratio of value to money raised
+            value_ratio = total_value / money_raised if money_raised > 0 else float('inf')
+            
+            groups_with_development.append((group, value_ratio))
         
         # Sort groups by value ratio (lowest first)
-        groups_with_development.sort(key=lambda x: x[1])
+        groups_with_development.sort(key=itemgetter(1))
         
         # Add groups to downgrade suggestions
         for group, _ in groups_with_development:
+            hotel_count, hotel_owner = game_state.hotels[group]
+            house_count, house_owner = game_state.houses[group]
+            
             # Validate downgrading
-            if group in game_state.hotels and game_state.hotels[group][0] > 0 and game_state.hotels[group][1] == self:
+            if hotel_count > 0 and hotel_owner == self:
                 if not GameValidation.validate_sell_hotel(game_state, self, group):
                     downgrade_suggestions.append(group)
-                    funds_raised += group.hotel_cost() // 2
-            elif group in game_state.houses and game_state.houses[group][0] > 0 and game_state.houses[group][1] == self:
+                    funds_raised += self._hotel_sale_values[group]
+            elif house_count > 0 and house_owner == self:
                 if not GameValidation.validate_sell_house(game_state, self, group):
                     downgrade_suggestions.append(group)
-                    num_properties = len(game_state.board.get_properties_by_group(group))
-                    funds_raised += (group.house_cost() // 2) * num_properties
+                    funds_raised += self._house_sale_values[group] * self._group_sizes[group]
             
             # Stop if we've raised enough funds
             if funds_raised >= needed:
                 break
+        
+        return funds_raised
 
 
 class AggressiveInvestor(StrategicAgent):
@@ -1824,6 +2136,8 @@ class LateGameDeveloper(StrategicAgent):
     - Conservative jail strategy early, more aggressive later
     """
     
+    __slots__ = ("_original_params",)
+    
     def __init__(self, name):
         strategy_params = {
             # Property acquisition
@@ -1932,6 +2246,8 @@ class DynamicAdapter(StrategicAgent):
     - Most complex AI with situational strategy shifts
     """
     
+    __slots__ = ("_last_opponent_states", "_board_analysis", "_strategy_mode")
+    
     def __init__(self, name):
         strategy_params = {
             # Start with balanced parameters
@@ -1950,48 +2266,60 @@ class DynamicAdapter(StrategicAgent):
         """Override to analyze game state and adapt strategy"""
         super()._update_turn_counter(game_state)
         
-        # Store opponent states for analysis
-        self._analyze_opponents(game_state)
-        
-        # Determine appropriate strategy mode
-        self._adapt_strategy(game_state)
+        # Store opponent states and adapt the strategy mode in one pass
+        self._refresh_opponent_stats(game_state)
     
-    def _analyze_opponents(self, game_state):
-        """Analyze opponents' positions and strategies"""
+    def _refresh_opponent_stats(self, game_state):
+        """Analyze opponents' positions and strategies, then adapt to them"""
+        development = self._development_by_player(game_state)
+        monopolies = self._monopolies_by_player(game_state)
+        max_opponent_properties = 0
+        
         for player in game_state.players:
             if player == self:
                 continue
                 
             # Track basic metrics
+            properties = len(game_state.properties[player])
             self._last_opponent_states[player] = {
                 "cash": game_state.player_balances[player],
-                "properties": len(game_state.properties[player]),
-                "development": self._calculate_opponent_development(game_state, player),
-                "monopolies": self._count_opponent_monopolies(game_state, player)
+                "properties": properties,
+                "development": development[player],
+                "monopolies": monopolies[player]
             }
-    
-    def _calculate_opponent_development(self, game_state, player):
-        """Calculate opponent's development level"""
-        development_score = 0
-        for group in PropertyGroup:
-            if game_state.houses[group][1] == player:
-                development_score += game_state.houses[group][0] * len(game_state.board.get_properties_by_group(group))
-            if game_state.hotels[group][1] == player:
-                development_score += 5 * len(game_state.board.get_properties_by_group(group))  # Hotel = 5 houses
+            if properties > max_opponent_properties:
+                max_opponent_properties = properties
         
-        return development_score
+        # Determine appropriate strategy mode
+        self._adapt_strategy(game_state, max_opponent_properties, development[self])
     
-    def _count_opponent_monopolies(self, game_state, player):
-        """Count how many monopolies an opponent has"""
-        monopoly_count = 0
+    def _development_by_player(self, game_state):
+        """Calculate every player's development level in one pass over the groups"""
+        self._refresh_board_cache(game_state)
+        group_sizes = self._group_sizes
+        development = defaultdict(int)
         for group in PropertyGroup:
-            properties = game_state.board.get_properties_by_group(group)
-            if all(p in game_state.properties[player] for p in properties):
-                monopoly_count += 1
-        
-        return monopoly_count
+            house_count, house_owner = game_state.houses[group]
+            _, hotel_owner = game_state.hotels[group]
+            group_size = group_sizes[group]
+            development[house_owner] += house_count * group_size
+            if hotel_owner is not None:
+                development[hotel_owner] += 5 * group_size  # Hotel = 5 houses
+        
+        return development
+    
+    def _monopolies_by_player(self, game_state):
+        """Count every player's monopolies in one pass over the groups"""
+        owner_of = {prop: player for player in game_state.players for prop in game_state.properties[player]}
+        monopolies = defaultdict(int)
+        for properties in self._get_group_properties(game_state).values():
+            owners = {owner_of.get(p) for p in properties}
+            if len(owners) == 1 and None not in owners:
+                monopolies[owners.pop()] += 1
+        
+        return monopolies
     
-    def _adapt_strategy(self, game_state):
+    def _adapt_strategy(self, game_state, max_opponent_properties, self_development):
         """Adapt strategy based on game analysis"""
         # Early game strategy (focus on acquisition)
         if self._current_turn <= 10:
@@ -2004,7 +2332,6 @@ class DynamicAdapter(StrategicAgent):
         elif self._current_turn <= 25:
             # Check if leading in properties
             self_properties = len(game_state.properties[self])
-            max_opponent_properties = max(len(game_state.properties[p]) for p in game_state.players if p != self)
             
             if self_properties > max_opponent_properties:
                 # Leading - focus on development
@@ -2019,8 +2346,7 @@ class DynamicAdapter(StrategicAgent):
                 
         # Late game strategy
         else:
-            # Count developed properties
-            self_development = self._calculate_opponent_development(game_state, self)
+            # Compare developed properties
             max_opponent_development = max(data["development"] for player, data in self._last_opponent_states.items())
             
             if self_development > max_opponent_development:
@@ -1,17 +1,27 @@
+import csv
 import itertools
 import multiprocessing as mp
-from functools import partial
 import pandas as pd
 import numpy as np
 import os
 import json
 import time
 import gc  # Import garbage collector
+import hashlib
+from functools import lru_cache
+import shelve
+import sqlite3
+from operator import itemgetter
 from tqdm import tqdm
 import traceback
-import random
+from multiprocessing.shared_memory import SharedMemory
 from typing import Dict, List, Any, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import required agent types and tournament manager
 from agents.strategic_agent import StrategicAgent
 from agents.strategic_agent import (
@@ -29,6 +39,11 @@ PHASE1_NUM_CONFIGS = 100        # Number of random configurations to generate
 PHASE1_GAMES_PER_MATCHUP = 20   # Games per matchup in phase 1
 PHASE1_MAX_TURNS = 300          # Maximum turns per game in phase 1
 
+# Successive halving rungs of phase 1 as (share of PHASE1_GAMES_PER_MATCHUP,
+# share of PHASE1_NUM_CONFIGS): every configuration is first scored on a few
+# games and only the best are promoted to the longer, more reliable rungs
+PHASE1_RUNGS = [(0.25, 1.0), (0.5, 0.3), (1.0, 0.1)]
+
 PHASE2_TOP_CONFIGS = 10         # Number of top configurations to take from phase 1
 PHASE2_GAMES_PER_MATCHUP = 30   # Games per matchup in phase 2
 PHASE2_MAX_TURNS = 500          # Maximum turns per game in phase 2
@@ -43,6 +58,53 @@ PHASE4_MAX_TURNS = 750          # Maximum turns per game in phase 4
 
 NUM_PROCESSES = 4               # Number of parallel processes to use
 
+# Reference players as (factory, name) pairs; agents keep per-game state, so
+# each phase builds its own instances with create_players
+STRATEGIC_VARIANT_FACTORIES = [
+    (StrategicAgent, "Strategic"),
+    (AggressiveInvestor, "Aggressive"),
+    (CautiousAccumulator, "Cautious"),
+    (CompletionistBuilder, "Completionist"),
+    (UtilityKing, "UtilityKing"),
+    (OrangeRedSpecialist, "OrangeRed"),
+    (LateGameDeveloper, "LateGame"),
+    (Trademaster, "Trademaster"),
+    (BalancedAgent, "Balanced"),
+    (DynamicAdapter, "Dynamic")
+]
+BASELINE_FACTORIES = [
+    (AlgorithmicAgent, "Algorithmic"),
+    (RandomAgent, "Random")
+]
+WORKER_MAX_TASKS = 8            # Tournaments a worker runs before it is replaced
+
+# Modules imported once by the forkserver, so phase 1 workers start with them loaded
+FORKSERVER_PRELOAD = ["numpy", "agents.strategic_agent", "managers.tournament_manager"]
+
+# Code and data, relative to src, that game outcomes depend on; cached games
+# played with any other version of them are not reused
+GAME_CODE_PATHS = ("agents/strategic_agent.py", "game", "managers", "models", "events", "exceptions", "../data")
+
+# Per-game outcome fields, in the order workers store them in the shared outcomes array
+GAME_OUTCOME_FIELDS = ("valid", "won", "survived", "net_worth")
+
+# Settings shared by every task of a worker, set once by _init_worker
+_WORKER_CTX = {}
+
+# Tournaments allocate many small dicts and lists; collecting less often than
+# the default keeps the collector from running every few hundred allocations.
+# Set by main() and by the pool workers, not on import
+_gen0, _gen1, _gen2 = gc.get_threshold()
+_GC_THRESHOLD = (_gen0 * 8, _gen1 * 2, _gen2 * 2)
+
+# Decimals kept by compact float columns of the configurations array; generated
+# parameters have two, so they survive the float32 round trip exactly
+CONFIG_FLOAT_DECIMALS = 3
+
+# Default strategy parameters, the base of every generated configuration and
+# the parameters of the default opponent. Copy before modifying
+_DEFAULT_PARAMS = StrategicAgent("Strategic")._get_default_params()
+
 def convert_to_serializable(obj):
     """Convert NumPy types to Python native types for JSON serialization."""
     if isinstance(obj, dict):
@@ -60,63 +122,183 @@ def convert_to_serializable(obj):
     else:
         return obj
 
-def run_tournament_vs_default(params_config, games_per_matchup=20, max_turns=300, output_dir="phase1_results"):
-    """Run a tournament against the default strategic player."""
+def write_json(obj, path):
+    """Write obj to path as indented JSON, NumPy values included."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(convert_to_serializable(obj), f, indent=2)
+
+def create_players(factories):
+    """Build fresh players from (factory, name) pairs."""
+    return [factory(name) for factory, name in factories]
+
+def write_csv(rows, path):
+    """Write a list of same-keyed dicts to path as CSV, with a header row."""
+    with open(path, "w", newline="") as f:
+        if rows:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+def _get_pool_context():
+    """Multiprocessing context for phase 1 workers, started from a small preloaded forkserver when available."""
+    if "forkserver" not in mp.get_all_start_methods():
+        return mp.get_context()
+    context = mp.get_context("forkserver")
+    context.set_forkserver_preload(FORKSERVER_PRELOAD)
+    return context
+
+@lru_cache(maxsize=None)
+def _game_code_version():
+    """Digest of the agent and game code and data that decide game outcomes."""
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths = []
+    for relative_path in GAME_CODE_PATHS:
+        path = os.path.normpath(os.path.join(src_dir, relative_path))
+        if os.path.isfile(path):
+            paths.append(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            paths.extend(os.path.join(root, name) for name in files if name.endswith((".py", ".json")))
+    
+    digest = hashlib.blake2b(digest_size=8)
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, src_dir).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def _matchup_cache_key(params, opponent_params, max_turns):
+    """Key the games of a matchup by both players' parameters, the turn limit and the game code version."""
+    digests = [
+        hashlib.blake2b(json.dumps(p, sort_keys=True).encode(), digest_size=16).hexdigest()
+        for p in (params, opponent_params)
+    ]
+    return f"{digests[0]}:{digests[1]}:{max_turns}:{_game_code_version()}"
+
+def _game_seed(matchup_key, game_number):
+    """Random seed of one game of a matchup, the same in every run and every phase."""
+    digest = hashlib.blake2b(f"{matchup_key}:{game_number}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+def _score_games(config_id, games):
+    """Aggregate per-game outcomes into the metrics and combined score of a configuration."""
+    valid_games = [game for game in games if game["valid"]]
+    if valid_games:
+        win_rate = sum(game["won"] for game in valid_games) / len(valid_games)
+        avg_net_worth = sum(game["net_worth"] for game in valid_games) / len(valid_games)
+        survival_rate = sum(game["survived"] for game in valid_games) / len(valid_games)
+    else:
+        win_rate = avg_net_worth = survival_rate = 0.0
+    
+    # Calculate combined score (weighted metrics)
+    score = win_rate * 0.5 + (survival_rate * 0.3) + (avg_net_worth / 5000) * 0.2
+    
+    return {
+        "config_id": config_id,
+        "win_rate": win_rate,
+        "avg_net_worth": avg_net_worth,
+        "survival_rate": survival_rate,
+        "score": score
+    }
+
+def _init_worker(games_per_matchup, max_turns, output_dir, configs_path, outcomes_name, outcomes_shape):
+    """Store the settings shared by all tournaments of a pool worker and attach the shared outcomes array."""
+    gc.set_threshold(*_GC_THRESHOLD)
+    outcomes_memory = SharedMemory(name=outcomes_name)
+    _WORKER_CTX.update(
+        games_per_matchup=games_per_matchup,
+        max_turns=max_turns,
+        output_dir=output_dir,
+        configs_path=configs_path,
+        outcomes_memory=outcomes_memory,
+        outcomes=np.ndarray(outcomes_shape, dtype=np.float64, buffer=outcomes_memory.buf)
+    )
+
+def _compact_column_type(values):
+    """Smallest array type that stores every value of a parameter column without loss."""
+    if isinstance(values[0], bool):
+        return np.bool_
+    if isinstance(values[0], int):
+        limits = np.iinfo(np.int16)
+        return np.int16 if all(limits.min <= value <= limits.max for value in values) else np.int64
+    if all(round(float(np.float32(value)), CONFIG_FLOAT_DECIMALS) == value for value in values):
+        return np.float32
+    return np.float64
+
+def save_configs_array(configs, path):
+    """Save configurations as a structured array with one row per config id, for memory-mapping."""
+    configs = sorted(configs, key=itemgetter("id"))
+    names = list(configs[0]["params"])
+    rows = [tuple(config["params"][name] for name in names) for config in configs]
+    dtype = [(name, _compact_column_type(column)) for name, column in zip(names, zip(*rows))]
+    np.save(path, np.array(rows, dtype=dtype))
+
+def _get_worker_params(config_id):
+    """Get the parameters of a configuration, memory-mapping the saved configurations on first use."""
+    if "configs" not in _WORKER_CTX:
+        configs = np.load(_WORKER_CTX["configs_path"], mmap_mode="r")
+        _WORKER_CTX["configs"] = configs
+        _WORKER_CTX["float32_columns"] = {
+            name for name in configs.dtype.names if configs.dtype[name] == np.float32
+        }
+    row = _WORKER_CTX["configs"][config_id]
+    float32_columns = _WORKER_CTX["float32_columns"]
+    return {
+        name: round(row[name].item(), CONFIG_FLOAT_DECIMALS) if name in float32_columns else row[name].item()
+        for name in row.dtype.names
+    }
+
+def run_tournament_vs_default(task):
+    """Play the games of a configuration against the default strategic player that are not cached yet.
+    
+    The task is (config_id, matchup_key, first_game); games first_game to games_per_matchup - 1
+    are played, each seeded by its number, and the player's outcome in each is written to the
+    configuration's row of the shared outcomes array. Returns the config id, or a failed result.
+    """
+    config_id, matchup_key, first_game = task
+    games_per_matchup = _WORKER_CTX.get("games_per_matchup", 20)
+    max_turns = _WORKER_CTX.get("max_turns", 300)
+    output_dir = _WORKER_CTX.get("output_dir", "phase1_results")
+    
     try:
         # Create player with specified parameters
-        player_name = f"GridSearch_Player_{params_config['id']}"
-        player = StrategicAgent(player_name, params_config['params'])
+        player_name = f"GridSearch_Player_{config_id}"
+        player = StrategicAgent(player_name, _get_worker_params(config_id))
         
         # Create default strategic player as opponent
         opponent = StrategicAgent("Strategic")
         
-        # Create tournament directory
-        config_dir = os.path.join(output_dir, f"config_{params_config['id']}")
-        os.makedirs(config_dir, exist_ok=True)
-        
-        # Run tournament
-        tournament_manager = TournamentManager(output_dir=config_dir)
-        results = tournament_manager.run_2player_tournament(
+        # Only the per-game outcomes of the probed player are kept, so no result
+        # files are written and one tournament manager serves every task of a worker
+        if "tournament_manager" not in _WORKER_CTX:
+            _WORKER_CTX["tournament_manager"] = TournamentManager(output_dir=output_dir)
+        metrics = _WORKER_CTX["tournament_manager"].run_2player_tournament(
             players=[player, opponent],
-            games_per_matchup=games_per_matchup,
+            games_per_matchup=games_per_matchup - first_game,
             max_turns=max_turns,
             parallel=False,  # No nested parallelism to avoid memory issues
             collect_turn_data=False,
-            save_event_log=False
+            save_event_log=False,
+            return_only_player=player_name,
+            game_seeds=[_game_seed(matchup_key, game) for game in range(first_game, games_per_matchup)]
         )
         
-        # Extract only essential metrics
-        win_rate = next((r["win_rate"] for r in results["overall_stats"]["player_rankings"] 
-                         if player_name in r["player"]), 0)
-        avg_net_worth = next((r["avg_net_worth"] for r in results["overall_stats"]["player_rankings"] 
-                             if player_name in r["player"]), 0)
-        survival_rate = next((r["survival_rate"] for r in results["overall_stats"]["player_rankings"] 
-                             if player_name in r["player"]), 0)
-        
-        # Calculate combined score (weighted metrics)
-        score = win_rate * 0.5 + (survival_rate * 0.3) + (avg_net_worth / 5000) * 0.2
-        
-        # Clean up to free memory
-        del tournament_manager
-        del results
-        gc.collect()
-        
-        return {
-            "config_id": params_config['id'],
-            "params": params_config['params'],
-            "win_rate": win_rate,
-            "avg_net_worth": avg_net_worth,
-            "survival_rate": survival_rate,
-            "score": score
-        }
+        _WORKER_CTX["outcomes"][config_id, first_game:games_per_matchup] = [
+            [game[field] for field in GAME_OUTCOME_FIELDS] for game in metrics["games"]
+        ]
+        return config_id
     except Exception as e:
         # Log error and return failed result
-        print(f"Error in tournament {params_config['id']}: {e}")
+        print(f"Error in tournament {config_id}: {e}")
         traceback.print_exc()
         
         return {
-            "config_id": params_config['id'],
-            "params": params_config['params'],
+            "config_id": config_id,
             "win_rate": 0.0,
             "avg_net_worth": 0.0,
             "survival_rate": 0.0,
@@ -126,9 +308,6 @@ def run_tournament_vs_default(params_config, games_per_matchup=20, max_turns=300
 
 def create_random_param_configs(num_configs=100):
     """Create random parameter configurations for initial search with all parameters."""
-    # Get default parameters as reference
-    default_params = StrategicAgent("Strategic")._get_default_params()
-    
     # Define parameter ranges - more extreme to explore wider space
     param_ranges = {
         # Property acquisition
@@ -176,26 +355,128 @@ def create_random_param_configs(num_configs=100):
         "danger_zone_weight": (0.8, 2.0)
     }
     
-    # Generate random configurations
+    # Split the ranges by parameter type so each type is sampled in one draw
+    bool_params = [param for param in param_ranges if param == "bankruptcy_mortgage_first"]
+    int_params = [param for param in param_ranges
+                  if param not in bool_params and isinstance(_DEFAULT_PARAMS[param], int)]
+    float_params = [param for param in param_ranges
+                    if param not in bool_params and param not in int_params]
+    
+    # Generate random values for all configurations at once
+    rng = np.random.default_rng()
+    int_low, int_high = np.array([param_ranges[param] for param in int_params]).T
+    float_low, float_high = np.array([param_ranges[param] for param in float_params]).T
+    int_values = rng.integers(int_low, int_high + 1, size=(num_configs, len(int_params))).tolist()
+    float_values = rng.uniform(float_low, float_high, size=(num_configs, len(float_params))).round(2).tolist()
+    bool_values = rng.integers(0, 2, size=(num_configs, len(bool_params))).astype(bool).tolist()
+    
+    # Start each configuration from the default parameters and override the sampled ones
     configs = []
-    for i in range(num_configs):
-        # Start with default parameters
-        params = default_params.copy()
-        
-        # Override with random values
-        for param, value_range in param_ranges.items():
-            if param == "bankruptcy_mortgage_first":
-                # Handle boolean parameter
-                params[param] = random.choice(value_range)
-            elif isinstance(params[param], int):
-                params[param] = random.randint(value_range[0], value_range[1])
-            else:
-                params[param] = round(random.uniform(value_range[0], value_range[1]), 2)
-        
+    for i, (ints, floats, bools) in enumerate(zip(int_values, float_values, bool_values)):
+        params = _DEFAULT_PARAMS.copy()
+        params.update(zip(int_params, ints))
+        params.update(zip(float_params, floats))
+        params.update(zip(bool_params, bools))
         configs.append({"id": i, "params": params})
     
     return configs
 
+def _insert_result(results_db, rung, result):
+    """Store the result of a configuration in a rung."""
+    results_db.execute(
+        "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (rung, result["config_id"], result["win_rate"], result["avg_net_worth"],
+         result["survival_rate"], result["score"], result.get("error"))
+    )
+
+def open_results_db(path):
+    """Open the phase 1 results database, creating its table on first use."""
+    db = sqlite3.connect(path)
+    db.row_factory = sqlite3.Row
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS results ("
+        "rung INTEGER, config_id INTEGER, win_rate REAL, avg_net_worth REAL, "
+        "survival_rate REAL, score REAL, error TEXT, PRIMARY KEY (rung, config_id))"
+    )
+    return db
+
+def _run_phase1_rung(rung, config_ids, params_by_id, games_per_matchup, keep, output_dir, configs_path,
+                     results_db, num_processes):
+    """Score configurations against the default player at one budget and return the best `keep` results."""
+    # Games are seeded by their number, so the games of earlier rungs and of earlier
+    # runs on the same game code are the first games of this one; only the missing
+    # ones are played, which also lets interrupted searches resume
+    cache_keys = {
+        config_id: _matchup_cache_key(params_by_id[config_id], _DEFAULT_PARAMS, PHASE1_MAX_TURNS)
+        for config_id in config_ids
+    }
+    
+    # Workers write game outcomes into a shared (config, game, field) array
+    # rather than sending them back through the pool's pipes
+    outcomes_shape = (len(params_by_id), games_per_matchup, len(GAME_OUTCOME_FIELDS))
+    outcomes_memory = SharedMemory(create=True, size=int(np.prod(outcomes_shape)) * np.dtype(np.float64).itemsize)
+    outcomes = np.ndarray(outcomes_shape, dtype=np.float64, buffer=outcomes_memory.buf)
+    
+    # Run tournaments in parallel; shared settings are sent once per worker,
+    # so each task only carries its configuration id and where its games start
+    try:
+        with shelve.open(os.path.join(OUTPUT_DIR, "matchup_cache")) as cache, _get_pool_context().Pool(
+            processes=num_processes,
+            initializer=_init_worker,
+            initargs=(games_per_matchup, PHASE1_MAX_TURNS, output_dir, configs_path,
+                      outcomes_memory.name, outcomes_shape),
+            maxtasksperchild=WORKER_MAX_TASKS
+        ) as pool, results_db:
+            # Configurations are generated anew on every run, so earlier results of the rung are stale
+            results_db.execute("DELETE FROM results WHERE rung = ?", (rung,))
+            
+            pending = []
+            cached_games = 0
+            for config_id, key in cache_keys.items():
+                games = cache.get(key, [])
+                cached_games += min(len(games), games_per_matchup)
+                if len(games) >= games_per_matchup:
+                    _insert_result(results_db, rung, _score_games(config_id, games[:games_per_matchup]))
+                else:
+                    pending.append((config_id, key, len(games)))
+            
+            if cached_games:
+                print(f"Phase 1: Reusing {cached_games} cached game results")
+            
+            # Store each result as it completes instead of keeping them all in memory;
+            # workers return the config id, so completion order does not matter
+            first_games = {config_id: first_game for config_id, _, first_game in pending}
+            chunksize = max(1, len(pending) // (num_processes * 4))
+            for result in tqdm(pool.imap_unordered(run_tournament_vs_default, pending, chunksize=chunksize),
+                               total=len(pending)):
+                if not isinstance(result, dict):
+                    config_id = result
+                    key = cache_keys[config_id]
+                    games = cache.get(key, []) + [
+                        {field: value.item() for field, value in zip(GAME_OUTCOME_FIELDS, row)}
+                        for row in outcomes[config_id, first_games[config_id]:]
+                    ]
+                    cache[key] = games
+                    result = _score_games(config_id, games[:games_per_matchup])
+                _insert_result(results_db, rung, result)
+            
+            # Let workers exit on their own rather than being terminated with the pool
+            pool.close()
+            pool.join()
+    finally:
+        del outcomes
+        outcomes_memory.close()
+        outcomes_memory.unlink()
+    
+    # Pick the top configurations of the rung, skipping failed runs
+    rows = results_db.execute(
+        "SELECT config_id, win_rate, avg_net_worth, survival_rate, score FROM results "
+        "WHERE rung = ? AND error IS NULL ORDER BY score DESC LIMIT ?",
+        (rung, keep)
+    )
+    return [dict(row) for row in rows]
+
 def phase1_random_search(num_processes=4):
     """Phase 1: Generate and evaluate random configurations against default player."""
     # Create output directory
@@ -206,62 +487,49 @@ def phase1_random_search(num_processes=4):
     configs = create_random_param_configs(PHASE1_NUM_CONFIGS)
     print(f"Phase 1: Generated {len(configs)} random parameter configurations")
     
-    # Save configurations
-    with open(os.path.join(output_dir, "phase1_configs.json"), "w") as f:
-        json.dump(convert_to_serializable(configs), f, indent=2)
-    
-    # Run tournaments in parallel
-    with mp.Pool(processes=num_processes) as pool:
-        run_func = partial(run_tournament_vs_default, 
-                          games_per_matchup=PHASE1_GAMES_PER_MATCHUP, 
-                          max_turns=PHASE1_MAX_TURNS,
-                          output_dir=output_dir)
-        
-        # Process results as they complete to avoid storing all in memory
-        results = []
-        for result in tqdm(pool.imap(run_func, configs), total=len(configs)):
-            # Add to our minimal results list
-            results.append(result)
-            
-            # Force garbage collection after each tournament
-            gc.collect()
-    
-    # Free memory from configs
-    del configs
-    gc.collect()
-    
-    # Save all results to disk
-    with open(os.path.join(output_dir, "phase1_results.json"), "w") as f:
-        json.dump(convert_to_serializable(results), f, indent=2)
-    
-    # Create DataFrame only for analysis
-    df = pd.DataFrame(results)
+    # Save configurations, and an array copy that workers memory-map their parameters from
+    write_json(configs, os.path.join(output_dir, "phase1_configs.json"))
+    configs_path = os.path.join(output_dir, "phase1_configs.npy")
+    save_configs_array(configs, configs_path)
+    params_by_id = {config["id"]: config["params"] for config in configs}
+    
+    # Results of every rung go to a single database rather than one file each
+    results_db = open_results_db(os.path.join(output_dir, "phase1_results.sqlite"))
+    
+    # Successive halving: score all configurations cheaply, then re-score only
+    # the best ones with more games per matchup
+    config_ids = list(params_by_id)
+    for rung, (games_share, _) in enumerate(PHASE1_RUNGS):
+        games_per_matchup = max(1, round(PHASE1_GAMES_PER_MATCHUP * games_share))
+        if rung + 1 < len(PHASE1_RUNGS):
+            keep = max(PHASE2_TOP_CONFIGS, round(PHASE1_NUM_CONFIGS * PHASE1_RUNGS[rung + 1][1]))
+        else:
+            keep = PHASE2_TOP_CONFIGS
+        
+        print(f"Phase 1 rung {rung + 1}: {len(config_ids)} configurations, "
+              f"{games_per_matchup} games per matchup")
+        best = _run_phase1_rung(
+            rung + 1, config_ids, params_by_id, games_per_matchup, keep, output_dir, configs_path,
+            results_db, num_processes
+        )
+        config_ids = [result["config_id"] for result in best]
+    results_db.close()
     
-    # Remove rows with errors
-    if "error" in df.columns:
-        df = df[df["error"].isna()]
+    for result in best:
+        result["params"] = params_by_id[result["config_id"]]
     
-    # Extract just the top configurations
-    df = df.sort_values("score", ascending=False)
-    best_configs = df.head(PHASE2_TOP_CONFIGS)
+    # Only the few best rows become a DataFrame, indexed by configuration id
+    best_configs = pd.DataFrame(best, index=[result["config_id"] for result in best])
     
     # Print summary without storing complete results
     print("\nBest configurations from Phase 1 (Random Search):")
     print(best_configs[["config_id", "win_rate", "avg_net_worth", "survival_rate", "score"]])
     
     # Save best configurations
-    best_configs.to_csv(os.path.join(output_dir, "phase1_best_configs.csv"), index=False)
+    write_csv(best, os.path.join(output_dir, "phase1_best_configs.csv"))
     
-    # Clean up memory before returning only necessary data
-    best_params = best_configs[["config_id", "params", "score"]].copy()
-    
-    # Free memory
-    del df
-    del best_configs
-    del results
-    gc.collect()
-    
-    return best_params
+    # Return only the data the next phase needs
+    return best_configs[["config_id", "params", "score"]].copy()
 
 def run_tournament_with_players(players, games_per_matchup, max_turns, output_dir, phase_name, num_processes):
     """Run a tournament with the given players and return minimal results."""
@@ -273,6 +541,10 @@ def run_tournament_with_players(players, games_per_matchup, max_turns, output_di
     # Run tournament
     tournament_manager = TournamentManager(output_dir=output_dir)
     
+    # Keep forked tournament workers from dirtying the parent's pages
+    gc.collect()
+    gc.freeze()
+    
     try:
         # Run tournament
         results = tournament_manager.run_2player_tournament(
@@ -296,24 +568,21 @@ def run_tournament_with_players(players, games_per_matchup, max_turns, output_di
             })
         
         # Save rankings only (not full results)
+        write_csv(minimal_rankings, os.path.join(output_dir, f"{phase_name.lower()}_rankings.csv"))
         rankings_df = pd.DataFrame(minimal_rankings)
-        rankings_df.to_csv(os.path.join(output_dir, f"{phase_name.lower()}_rankings.csv"), index=False)
         
         # Print rankings
         print(f"\n{phase_name} Rankings:")
         print(rankings_df[["player", "win_rate", "avg_net_worth", "survival_rate"]])
         
-        # Free memory
-        del results
-        del tournament_manager
-        gc.collect()
-        
         return rankings_df
         
     except Exception as e:
         print(f"Error in {phase_name} tournament: {e}")
         traceback.print_exc()
         return None
+    finally:
+        gc.unfreeze()
 
 def phase2_variant_tournament(best_params_from_phase1, num_processes=4):
     """Phase 2: Run tournament with best configs from phase 1 against default variants."""
@@ -334,22 +603,10 @@ def phase2_variant_tournament(best_params_from_phase1, num_processes=4):
         player_params_map[player_name] = params
     
     # Save this mapping for later phases
-    with open(os.path.join(output_dir, "player_params_map.json"), "w") as f:
-        json.dump(convert_to_serializable(player_params_map), f, indent=2)
+    write_json(player_params_map, os.path.join(output_dir, "player_params_map.json"))
     
     # Create default variant players
-    variant_players = [
-        StrategicAgent("Strategic"),
-        AggressiveInvestor("Aggressive"),
-        CautiousAccumulator("Cautious"),
-        CompletionistBuilder("Completionist"),
-        UtilityKing("UtilityKing"),
-        OrangeRedSpecialist("OrangeRed"),
-        LateGameDeveloper("LateGame"),
-        Trademaster("Trademaster"),
-        BalancedAgent("Balanced"),
-        DynamicAdapter("Dynamic")
-    ]
+    variant_players = create_players(STRATEGIC_VARIANT_FACTORIES)
     
     # All players for the tournament
     all_players = best_players + variant_players
@@ -365,7 +622,7 @@ def phase2_variant_tournament(best_params_from_phase1, num_processes=4):
     
     # Extract top Phase1_Best players for next phase
     top_configs = []
-    for i, row in rankings.iterrows():
+    for row in rankings.to_dict("records"):
         if "Phase1_Best" in row["player"]:
             player_name = row["player"]
             
@@ -384,8 +641,9 @@ def phase2_variant_tournament(best_params_from_phase1, num_processes=4):
     # If we couldn't find enough ranked Phase1_Best players
     if len(top_configs) < PHASE3_TOP_CONFIGS:
         # Use more from the original best configs
-        for i, (player, params) in enumerate(player_params_map.items()):
-            if player not in [config["player"] for config in top_configs]:
+        selected_players = {config["player"] for config in top_configs}
+        for player, params in player_params_map.items():
+            if player not in selected_players:
                 top_configs.append({
                     "player": player,
                     "params": params,
@@ -398,18 +656,9 @@ def phase2_variant_tournament(best_params_from_phase1, num_processes=4):
                     break
     
     # Save just the essential data for the next phase
-    top_configs_df = pd.DataFrame(top_configs)
-    top_configs_df.to_csv(os.path.join(output_dir, "top_configs_for_phase3.csv"), index=False)
-    
-    # Free memory
-    del rankings
-    del player_params_map
-    del best_players
-    del variant_players
-    del all_players
-    gc.collect()
+    write_csv(top_configs, os.path.join(output_dir, "top_configs_for_phase3.csv"))
     
-    return top_configs_df
+    return pd.DataFrame(top_configs)
 
 def phase3_refinement_tournament(top_configs_from_phase2, num_processes=4):
     """Phase 3: Run tournament with only top configurations to refine rankings."""
@@ -429,8 +678,7 @@ def phase3_refinement_tournament(top_configs_from_phase2, num_processes=4):
         player_params_map[player_name] = params
     
     # Save mapping for reference
-    with open(os.path.join(output_dir, "player_params_map.json"), "w") as f:
-        json.dump(convert_to_serializable(player_params_map), f, indent=2)
+    write_json(player_params_map, os.path.join(output_dir, "player_params_map.json"))
     
     # Run tournament and get rankings
     rankings = run_tournament_with_players(
@@ -443,7 +691,7 @@ def phase3_refinement_tournament(top_configs_from_phase2, num_processes=4):
     
     # Extract top performers for final phase
     top_configs = []
-    for i, row in rankings.iterrows():
+    for row in rankings.to_dict("records"):
         player_name = row["player"]
         
         if player_name in player_params_map:
@@ -459,16 +707,9 @@ def phase3_refinement_tournament(top_configs_from_phase2, num_processes=4):
                 break
     
     # Save for next phase
-    top_configs_df = pd.DataFrame(top_configs)
-    top_configs_df.to_csv(os.path.join(output_dir, "top_configs_for_phase4.csv"), index=False)
-    
-    # Free memory
-    del rankings
-    del player_params_map
-    del players
-    gc.collect()
+    write_csv(top_configs, os.path.join(output_dir, "top_configs_for_phase4.csv"))
     
-    return top_configs_df
+    return pd.DataFrame(top_configs)
 
 def phase4_final_tournament(top_configs_from_phase3, num_processes=4):
     """Phase 4: Final tournament with best configs and all default variants."""
@@ -483,24 +724,10 @@ def phase4_final_tournament(top_configs_from_phase3, num_processes=4):
         best_players.append(player)
         
         # Save each optimal configuration for reference
-        with open(os.path.join(output_dir, f"optimized_config_{i+1}.json"), "w") as f:
-            json.dump(convert_to_serializable(params), f, indent=2)
+        write_json(params, os.path.join(output_dir, f"optimized_config_{i+1}.json"))
     
     # Create all default variant players
-    variant_players = [
-        StrategicAgent("Strategic"),
-        AggressiveInvestor("Aggressive"),
-        CautiousAccumulator("Cautious"),
-        CompletionistBuilder("Completionist"),
-        UtilityKing("UtilityKing"),
-        OrangeRedSpecialist("OrangeRed"),
-        LateGameDeveloper("LateGame"),
-        Trademaster("Trademaster"),
-        BalancedAgent("Balanced"),
-        DynamicAdapter("Dynamic"),
-        AlgorithmicAgent("Algorithmic"),
-        RandomAgent("Random")
-    ]
+    variant_players = create_players(STRATEGIC_VARIANT_FACTORIES + BASELINE_FACTORIES)
     
     # All players for the final tournament
     all_players = best_players + variant_players
@@ -517,16 +744,7 @@ def phase4_final_tournament(top_configs_from_phase3, num_processes=4):
     # Generate final report with just the rankings
     generate_final_report(rankings, top_configs_from_phase3, output_dir)
     
-    # Free memory before returning
-    result = {"completed": True}
-    
-    del rankings
-    del best_players
-    del variant_players
-    del all_players
-    gc.collect()
-    
-    return result
+    return {"completed": True}
 
 def generate_final_report(rankings, top_configs, output_dir):
     """Generate detailed report of the optimized configurations."""
@@ -539,25 +757,29 @@ def generate_final_report(rankings, top_configs, output_dir):
         f.write(rankings[["player", "win_rate", "survival_rate", "avg_net_worth"]].to_string(index=False))
         f.write("\n\n")
         
+        # Look players up by name from here on
+        ranked = rankings.set_index("player")
+        
         # Check how optimized configurations performed
-        optimized_rankings = rankings[rankings["player"].str.contains("Optimized")].copy()
+        optimized_rankings = ranked.filter(like="Optimized", axis=0)
         f.write(f"Optimized Configurations Performance:\n")
-        f.write(optimized_rankings[["player", "win_rate", "survival_rate", "avg_net_worth"]].to_string(index=False))
+        f.write(optimized_rankings[["win_rate", "survival_rate", "avg_net_worth"]].reset_index().to_string(index=False))
         f.write("\n\n")
         
         # Analyze top performer
         if not optimized_rankings.empty:
-            top_idx = optimized_rankings.index[0]
-            top_config_idx = int(optimized_rankings.iloc[0]["player"].split("_")[-1]) - 1
+            top_player = optimized_rankings.index[0]
+            top_row = optimized_rankings.iloc[0]
+            top_config_idx = int(top_player.split("_")[-1]) - 1
             
             if top_config_idx < len(top_configs):
                 top_config = top_configs.iloc[top_config_idx]
                 
                 f.write("== TOP PERFORMING CONFIGURATION ==\n")
-                f.write(f"Player: {optimized_rankings.iloc[0]['player']}\n")
-                f.write(f"Win Rate: {optimized_rankings.iloc[0]['win_rate']:.2%}\n")
-                f.write(f"Survival Rate: {optimized_rankings.iloc[0]['survival_rate']:.2%}\n")
-                f.write(f"Average Net Worth: {optimized_rankings.iloc[0]['avg_net_worth']:.2f}₩\n\n")
+                f.write(f"Player: {top_player}\n")
+                f.write(f"Win Rate: {top_row['win_rate']:.2%}\n")
+                f.write(f"Survival Rate: {top_row['survival_rate']:.2%}\n")
+                f.write(f"Average Net Worth: {top_row['avg_net_worth']:.2f}₩\n\n")
                 
                 f.write("Parameter Configuration:\n")
                 for param, value in top_config["params"].items():
@@ -566,14 +788,13 @@ def generate_final_report(rankings, top_configs, output_dir):
                 f.write("\n\n")
                 
                 # Compare with default strategic player
-                default_idx = rankings[rankings["player"] == "DefaultStrategic"].index
-                if len(default_idx) > 0:
-                    default_idx = default_idx[0]
-                    default_rank = default_idx + 1
+                if "DefaultStrategic" in ranked.index:
+                    default_row = ranked.loc["DefaultStrategic"]
+                    default_rank = ranked.index.get_loc("DefaultStrategic") + 1
                     
-                    win_rate_diff = optimized_rankings.iloc[0]['win_rate'] - rankings.iloc[default_idx]['win_rate']
-                    survival_diff = optimized_rankings.iloc[0]['survival_rate'] - rankings.iloc[default_idx]['survival_rate']
-                    networth_diff = optimized_rankings.iloc[0]['avg_net_worth'] - rankings.iloc[default_idx]['avg_net_worth']
+                    win_rate_diff = top_row['win_rate'] - default_row['win_rate']
+                    survival_diff = top_row['survival_rate'] - default_row['survival_rate']
+                    networth_diff = top_row['avg_net_worth'] - default_row['avg_net_worth']
                     
                     f.write("== COMPARISON WITH DEFAULT STRATEGIC PLAYER ==\n")
                     f.write(f"Default Strategic Rank: {default_rank}\n")
@@ -588,6 +809,8 @@ def generate_final_report(rankings, top_configs, output_dir):
 
 def main():
     """Main function to run the multi-phase parameter optimization process."""
+    gc.set_threshold(*_GC_THRESHOLD)
+    
     try:
         # Create main output directory
         os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -600,9 +823,6 @@ def main():
         print("\n=== Phase 1: Random Search vs Default Player ===")
         phase1_results = phase1_random_search(num_processes=NUM_PROCESSES)
         
-        # Force cleanup after phase 1
-        gc.collect()
-        
         # Phase 2: Tournament with Default Variants
         print("\n=== Phase 2: Tournament with Default Variants ===")
         phase2_results = phase2_variant_tournament(
@@ -610,10 +830,6 @@ def main():
             num_processes=NUM_PROCESSES
         )
         
-        # Free phase 1 data
-        del phase1_results
-        gc.collect()
-        
         if isinstance(phase2_results, dict) and "error" in phase2_results:
             print(f"Error in Phase 2: {phase2_results['error']}")
             return
@@ -625,10 +841,6 @@ def main():
             num_processes=NUM_PROCESSES
         )
         
-        # Free phase 2 data
-        del phase2_results
-        gc.collect()
-        
         if isinstance(phase3_results, dict) and "error" in phase3_results:
             print(f"Error in Phase 3: {phase3_results['error']}")
             return
@@ -640,11 +852,6 @@ def main():
             num_processes=NUM_PROCESSES
         )
         
-        # Final cleanup
-        final_top_configs = phase3_results
-        del phase3_results
-        gc.collect()
-        
         # Generate final summary with minimal data
         summary_path = os.path.join(OUTPUT_DIR, "optimization_summary.txt")
         with open(summary_path, "w") as f:
@@ -656,9 +863,9 @@ def main():
             f.write("See final_report.txt for detailed analysis of the best configuration.\n\n")
             
             # Report minimal info about top configs
-            if len(final_top_configs) > 0:
+            if len(phase3_results) > 0:
                 f.write("=== TOP CONFIGURATION PARAMETERS ===\n")
-                for i, row in final_top_configs.head(1).iterrows():
+                for i, row in phase3_results.head(1).iterrows():
                     f.write(f"Configuration from: {row.get('player', f'Optimized_{i+1}')}\n")
                     for param, value in row["params"].items():
                         f.write(f"{param}: {value}\n")
@@ -669,9 +876,6 @@ def main():
         print(f"Error in main process: {e}")
         traceback.print_exc()
         return {"error": str(e)}
-    finally:
-        # Ensure garbage collection even on error
-        gc.collect()
 
 if __name__ == "__main__":
     main()
@@ -3,14 +3,24 @@ import time
 import numpy as np
 import tensorflow as tf
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from tqdm import tqdm
 import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
 from collections import deque
+from dataclasses import dataclass
 import random
 import json
 import gc
+import shutil
 from math import log, ceil
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from managers.game_manager import GameManager
 from agents.random_agent import RandomAgent
 from agents.algorithmic_agent import AlgorithmicAgent
@@ -25,7 +35,80 @@ from models.property_group import PropertyGroup
 # Set TensorFlow to only show errors
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
-def play_single_game_for_downgrading(agent_types, max_turns=200, dqn_observer=None):
+# Strategic agent whose downgrading decisions are recorded on behalf of the current
+# player; it keeps no per-player state, so one instance serves every game of a process
+DOWNGRADING_TEACHER = StrategicAgent("Downgrading_Teacher")
+
+# Action index of each property group, keyed by group value in enum order
+_GROUP_VALUE_TO_INDEX = {group.value: i for i, group in enumerate(PropertyGroup)}
+
+# Training stats are plotted on this thread so that saving a figure does not stall the game loop
+_plot_executor = ThreadPoolExecutor(max_workers=1)
+
+# Maximum turns of a data collection game; at most one decision is recorded per turn, so
+# this is also the number of state rows reserved per game in the shared state buffer
+COLLECTION_MAX_TURNS = 200
+
+# Upper bound on the size of the shared state buffer. The buffer lives in /dev/shm, where a
+# write past the space available kills the writing worker with SIGBUS, so games are
+# collected in batches that reuse the buffer; it is also kept to half of the free /dev/shm
+COLLECTION_SHARED_MEMORY_BYTES = 32 * 2**20
+
+# Share of turns without a downgrade suggestion that are still recorded as no-downgrade examples
+NO_DOWNGRADE_SAMPLE_RATE = 0.2
+
+# Batches trained per compiled call while pretraining
+PRETRAIN_INNER_BATCHES = 8
+
+# Per-process state of data collection workers, set once by _init_downgrading_worker
+_WORKER_CTX = {}
+
+# Modules imported once by the forkserver, so workers forked from it start with them loaded
+FORKSERVER_PRELOAD = ['numpy']
+
+def _get_pool_context():
+    """Multiprocessing context for worker pools, started from a small preloaded forkserver when available."""
+    # Forking this process would copy its TensorFlow state into every worker
+    if "forkserver" not in mp.get_all_start_methods():
+        return mp.get_context("spawn")
+    context = mp.get_context("forkserver")
+    context.set_forkserver_preload(FORKSERVER_PRELOAD)
+    return context
+
+def _limit_worker_tensorflow():
+    """
+    Keep TensorFlow in a worker process off the GPU and on a single thread.
+    
+    Workers only encode states or run small networks, so a GPU context or a TensorFlow
+    thread pool per worker would just compete with the main process and the other workers.
+    """
+    os.environ['CUDA_VISIBLE_DEVICES'] = '-1'
+    try:
+        tf.config.set_visible_devices([], 'GPU')
+        tf.config.threading.set_intra_op_parallelism_threads(1)
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+    except RuntimeError:
+        # TensorFlow was already initialized in this process; keep its configuration
+        pass
+
+def _collection_batch_games(num_games, state_dim):
+    """Number of games whose reserved state rows fit in the shared state buffer at once."""
+    budget = COLLECTION_SHARED_MEMORY_BYTES
+    if os.path.isdir('/dev/shm'):
+        budget = min(budget, shutil.disk_usage('/dev/shm').free // 2)
+    game_bytes = COLLECTION_MAX_TURNS * state_dim * np.dtype(np.float32).itemsize
+    return max(min(budget // game_bytes, num_games), 1)
+
+def _default_num_processes():
+    """Number of worker processes to use: the CPUs this process may run on, at most 8."""
+    if hasattr(os, 'sched_getaffinity'):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = mp.cpu_count()
+    return max(min(available, 8), 1)
+
+def play_single_game_for_downgrading(agent_types, max_turns=200, dqn_observer=None, states=None,
+                                     no_downgrade_sample_rate=NO_DOWNGRADE_SAMPLE_RATE):
     """
     Play a single game and collect downgrading experiences.
     
@@ -33,6 +116,9 @@ def play_single_game_for_downgrading(agent_types, max_turns=200, dqn_observer=No
         agent_types: List of agent types to use (not instances)
         max_turns: Maximum number of turns
         dqn_observer: Optional DQN agent to observe and learn
+        states: Optional float32 buffer of shape (max_turns, state_dim); the state of
+            each recorded turn is encoded into its row, and decisions hold views of those rows
+        no_downgrade_sample_rate: Probability of recording a turn without a downgrade suggestion
         
     Returns:
         Game data and collected experiences
@@ -48,6 +134,10 @@ def play_single_game_for_downgrading(agent_types, max_turns=200, dqn_observer=No
     active_players = len(players)
     downgrading_decisions = []
     
+    # Encode states into one buffer per game instead of a new array every turn
+    if dqn_observer and states is None:
+        states = np.empty((max_turns, dqn_observer.state_dim), dtype=np.float32)
+    
     try:
         while active_players > 1 and turn_counter < max_turns:
             current_player_idx = game_manager.game_state.current_player_index
@@ -56,44 +146,32 @@ def play_single_game_for_downgrading(agent_types, max_turns=200, dqn_observer=No
             # Record state before turn for downgrading decisions
             if dqn_observer:
                 try:
-                    # Encode current state
-                    current_state = dqn_observer.encode_state(game_manager.game_state)
-                    
-                    # Get the player's downgrading decision using a temporary DefaultStrategicPlayer
+                    # Get the downgrading decision the strategic agent would make for the current player
                     # This way we collect data on how the strategic agent makes decisions
-                    temp_player = StrategicAgent(f"Temp_{current_player.name}")
-                    # Copy current player's properties and position to temp player
-                    game_manager.game_state.properties[temp_player] = game_manager.game_state.properties[current_player]
-                    game_manager.game_state.player_positions[temp_player] = game_manager.game_state.player_positions[current_player]
-                    game_manager.game_state.player_balances[temp_player] = game_manager.game_state.player_balances[current_player]
-                    
-                    # Get suggestions from the temp player
-                    downgrade_groups = temp_player.get_downgrading_suggestions(game_manager.game_state)
+                    downgrade_groups = DOWNGRADING_TEACHER.get_downgrading_suggestions(
+                        game_manager.game_state, player=current_player
+                    )
                     
                     # Convert decision to action index
                     if downgrade_groups:
                         # Use the first group (in case multiple are returned)
                         selected_group = downgrade_groups[0]
-                        # Use the enum's ordinal (index) instead of trying to convert the string value
-                        action = selected_group.ordinal if hasattr(selected_group, 'ordinal') else list(PropertyGroup).index(selected_group)
+                        action = _GROUP_VALUE_TO_INDEX[selected_group.value]
                     else:
                         action = -1  # No downgrade
                     
-                    # Remove temp player from game state to avoid side effects
-                    if temp_player in game_manager.game_state.properties:
-                        del game_manager.game_state.properties[temp_player]
-                    if temp_player in game_manager.game_state.player_positions:
-                        del game_manager.game_state.player_positions[temp_player]
-                    if temp_player in game_manager.game_state.player_balances:
-                        del game_manager.game_state.player_balances[temp_player]
-                    
-                    # Record downgrading decision
-                    downgrading_decisions.append({
-                        'state': current_state,
-                        'action': action,
-                        'player': current_player,
-                        'turn': turn_counter
-                    })
+                    # Most turns have nothing to downgrade; only a sample of them is recorded,
+                    # and the state is encoded only for turns that are
+                    if action != -1 or random.random() < no_downgrade_sample_rate:
+                        current_state = dqn_observer.encode_state(game_manager.game_state, out=states[turn_counter])
+                        
+                        # Record downgrading decision
+                        downgrading_decisions.append({
+                            'state': current_state,
+                            'action': action,
+                            'player': current_player,
+                            'turn': turn_counter
+                        })
                 except Exception as e:
                     print(f"Error recording downgrading decision: {e}")
                     import traceback
@@ -134,31 +212,28 @@ def play_single_game_for_downgrading(agent_types, max_turns=200, dqn_observer=No
             'balance': game_manager.game_state.player_balances[player]
         }
     
-    # Calculate rewards for downgrading decisions
-    for decision in downgrading_decisions:
-        player = decision['player']
-        outcome = outcomes.get(player.name, {'net_worth': 0, 'winner': False, 'balance': 0})
+    # Calculate rewards for downgrading decisions, for all of them at once
+    if downgrading_decisions:
+        no_outcome = {'net_worth': 0, 'winner': False, 'balance': 0}
+        decision_outcomes = [outcomes.get(decision['player'].name, no_outcome) for decision in downgrading_decisions]
+        count = len(decision_outcomes)
+        net_worth = np.fromiter((outcome['net_worth'] for outcome in decision_outcomes), dtype=np.float64, count=count)
+        balance = np.fromiter((outcome['balance'] for outcome in decision_outcomes), dtype=np.float64, count=count)
+        winner = np.fromiter((outcome['winner'] for outcome in decision_outcomes), dtype=bool, count=count)
         
         # Reward calculation for downgrading - focus on financial stability and strategic management
-        if outcome['winner']:
-            decision['reward'] = 1.0
-        elif outcome['balance'] < 0:
-            # Bankruptcy - but downgrading might have delayed it, so less severe penalty
-            decision['reward'] = -0.7
-        else:
-            # Base reward on net worth, but consider cash management
-            net_worth_reward = np.clip(outcome['net_worth'] / 3000.0 - 0.5, -1.0, 1.0)
-            
-            # Bonus for maintaining positive cash balance (key for downgrading decisions)
-            cash_bonus = 0.0
-            if outcome['balance'] > 500:
-                cash_bonus = 0.2  # Good cash management
-            elif outcome['balance'] > 200:
-                cash_bonus = 0.1  # Adequate cash management
-            elif outcome['balance'] < 50:
-                cash_bonus = -0.3  # Poor cash management
-            
-            decision['reward'] = net_worth_reward + cash_bonus
+        # Base reward on net worth, but consider cash management: bonus for maintaining positive
+        # cash balance (key for downgrading decisions), good above 500, adequate above 200, poor below 50
+        rewards = np.clip(net_worth / 3000.0 - 0.5, -1.0, 1.0) + np.select(
+            [balance > 500, balance > 200, balance < 50], [0.2, 0.1, -0.3], default=0.0
+        )
+        
+        # Bankruptcy - but downgrading might have delayed it, so less severe penalty
+        rewards[balance < 0] = -0.7
+        rewards[winner] = 1.0
+        
+        for decision, reward in zip(downgrading_decisions, rewards.tolist()):
+            decision['reward'] = reward
     
     return {
         'turns': turn_counter,
@@ -188,6 +263,9 @@ def collect_downgrading_experiences(num_games=100, use_multiprocessing=True, num
         StrategicAgent
     ]
     
+    # Draw both players of every game up front, as indices into agent_types
+    agent_schedule = np.random.randint(0, len(agent_types), size=(num_games, 2))
+    
     # Create DQN observer to encode states
     # Use parent class implementation for all methods (no DQN)
     dqn_observer = DQNAgent(
@@ -200,39 +278,58 @@ def collect_downgrading_experiences(num_games=100, use_multiprocessing=True, num
     if use_multiprocessing and num_games > 10:
         # Set up multiprocessing
         if num_processes is None:
-            num_processes = min(mp.cpu_count() - 1, 8)  # Use at most 8 processes
-            num_processes = max(num_processes, 1)  # At least 1 process
+            num_processes = _default_num_processes()
         
         print(f"Using {num_processes} processes for data collection")
         
-        # Create arguments for each process
-        games_per_process = num_games // num_processes
-        remaining_games = num_games % num_processes
-        
-        process_args = []
-        for i in range(num_processes):
-            n_games = games_per_process
-            if i < remaining_games:
-                n_games += 1
-            process_args.append((n_games, agent_types, i))
+        # Workers write encoded states into a shared buffer with rows reserved for
+        # every game of a batch, and return decisions holding the row of their state,
+        # so no arrays are pickled between processes. The buffer is reused by each
+        # batch, which keeps it within the space /dev/shm can hold
+        batch_games = _collection_batch_games(num_games, dqn_observer.state_dim)
+        states_shape = (batch_games * COLLECTION_MAX_TURNS, dqn_observer.state_dim)
+        states_memory = SharedMemory(create=True, size=int(np.prod(states_shape)) * np.dtype(np.float32).itemsize)
         
-        # Start multiprocessing pool
-        with mp.Pool(processes=num_processes) as pool:
-            results = pool.map(_collect_downgrading_games_worker, process_args)
-        
-        # Combine results
+        # One task per game, handed out one at a time: a worker picks up the next game
+        # as soon as it finishes one, and decisions are gathered as games finish. Games
+        # vary a lot in length, so chunks of several games would leave workers idle
+        # behind a long game at the end of collection; the per-game results are small,
+        # as states stay in shared memory
         all_downgrading_decisions = []
-        for result in results:
-            all_downgrading_decisions.extend(result)
+        try:
+            shared_states = np.ndarray(states_shape, dtype=np.float32, buffer=states_memory.buf)
+            with _get_pool_context().Pool(
+                processes=num_processes,
+                initializer=_init_downgrading_worker,
+                initargs=(agent_types, agent_schedule, states_memory.name, states_shape)
+            ) as pool, tqdm(total=num_games, desc="Playing games") as progress:
+                for batch_start in range(0, num_games, batch_games):
+                    batch_decisions = []
+                    batch = range(batch_start, min(batch_start + batch_games, num_games))
+                    for game_decisions in pool.imap_unordered(_collect_downgrading_game_worker, batch):
+                        batch_decisions.extend(game_decisions)
+                        progress.update(1)
+                    
+                    # Copy the batch's used rows out of shared memory in one go, before the
+                    # next batch reuses them; each decision's state is a view into that copy
+                    states = shared_states[[decision.pop('state_index') for decision in batch_decisions]]
+                    for decision, state in zip(batch_decisions, states):
+                        decision['state'] = state
+                    all_downgrading_decisions.extend(batch_decisions)
+            del shared_states
+        finally:
+            states_memory.close()
+            states_memory.unlink()
         
+        print(f"Collected {len(all_downgrading_decisions)} downgrading decisions")
         return all_downgrading_decisions
     else:
         # Single process collection
         all_downgrading_decisions = []
         
         for i in tqdm(range(num_games), desc="Playing games"):
-            # Select random agent types for this game
-            game_agents = random.choices(agent_types, k=2)
+            # Look up this game's agent types in the schedule
+            game_agents = [agent_types[j] for j in agent_schedule[i]]
             
             # Play a game
             game_result = play_single_game_for_downgrading(game_agents, dqn_observer=dqn_observer)
@@ -243,71 +340,155 @@ def collect_downgrading_experiences(num_games=100, use_multiprocessing=True, num
         
         return all_downgrading_decisions
 
-def _collect_downgrading_games_worker(args):
+def _action_to_index(action):
     """
-    Worker function for parallel game collection.
+    Convert a recorded downgrading action to its action index.
     
     Args:
-        args: Tuple of (num_games, agent_types, process_id)
+        action: Property group value, numeric index, or anything else
         
     Returns:
-        List of downgrading decisions from games
+        Action index, -1 (no downgrade) for unknown or invalid actions
+    """
+    # Property group values map to their index
+    if isinstance(action, str):
+        return _GROUP_VALUE_TO_INDEX.get(action, -1)
+    # Keep numeric actions as-is (including -1 for no downgrade)
+    if isinstance(action, (int, float, np.integer)):
+        return int(action)
+    return -1
+
+def _init_downgrading_worker(agent_types, agent_schedule, states_name, states_shape):
     """
-    num_games, agent_types, process_id = args
+    Set up a data collection worker process.
+    
+    Args:
+        agent_types: List of agent types to draw game players from
+        agent_schedule: Array of shape (num_games, 2) with the agent type indices of each game
+        states_name: Name of the shared memory block holding encoded states
+        states_shape: Shape of the shared state buffer, (rows, state_dim), with
+            COLLECTION_MAX_TURNS rows for each game of a batch
+    """
+    # Workers forked from the same process inherit its random state; reseed so they play different games
+    random.seed()
+    np.random.seed()
+    
+    # The observer only encodes states, so TensorFlow gets no GPU and no thread pool
+    _limit_worker_tensorflow()
     
     # Create a dedicated DQN observer for this process
-    dqn_observer = DQNAgent(
-        f"DQN_Observer_{process_id}", 
-        state_dim=100, 
+    _WORKER_CTX['observer'] = DQNAgent(
+        f"DQN_Observer_{os.getpid()}", 
+        state_dim=states_shape[1], 
         training=False,
         dqn_methods={}  # Use parent class methods only
     )
+    _WORKER_CTX['agent_types'] = agent_types
+    _WORKER_CTX['agent_schedule'] = agent_schedule
     
-    downgrading_decisions = []
+    # Attach the shared state buffer
+    states_memory = SharedMemory(name=states_name)
+    _WORKER_CTX['states_memory'] = states_memory
+    _WORKER_CTX['states'] = np.ndarray(states_shape, dtype=np.float32, buffer=states_memory.buf)
     
-    # Create a mapping of property group values to indices
-    property_group_indices = {group.value: i for i, group in enumerate(PropertyGroup)}
+    # Modules and the observer live as long as the worker; move them out of the collector's scans
+    gc.collect()
+    gc.freeze()
+
+def _collect_downgrading_game_worker(game_idx):
+    """
+    Worker function for parallel game collection.
     
+    Args:
+        game_idx: Index of the game to play
+        
+    Returns:
+        List of downgrading decisions from the game, with the row of their
+        state in the shared state buffer instead of the state itself
+    """
+    # Batches start at multiples of the batch size, so the game's place in its batch gives its rows
+    states = _WORKER_CTX['states']
+    batch_games = len(states) // COLLECTION_MAX_TURNS
     try:
-        for i in tqdm(range(num_games), desc=f"Process {process_id}", position=process_id):
-            try:
-                # Select random agent types for this game
-                game_agents = random.choices(agent_types, k=2)
-                
-                # Play a game
-                game_result = play_single_game_for_downgrading(game_agents, dqn_observer=dqn_observer)
-                
-                # Add downgrading decisions to collection
-                if 'downgrading_decisions' in game_result:
-                    # Normalize actions to indices
-                    for decision in game_result['downgrading_decisions']:
-                        action = decision.get('action')
-                        
-                        # Convert string property group values to indices
-                        if isinstance(action, str) and action in property_group_indices:
-                            decision['action'] = property_group_indices[action]
-                        # Keep numeric actions as-is (including -1 for no downgrade)
-                        elif isinstance(action, (int, float)):
-                            decision['action'] = int(action)
-                        else:
-                            # Default to no downgrade if action is invalid
-                            decision['action'] = -1
-                    
-                    downgrading_decisions.extend(game_result['downgrading_decisions'])
-                    
-            except Exception as e:
-                print(f"Process {process_id}, Game {i} error: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
-                
+        # Look up this game's agent types in the schedule
+        agent_types = _WORKER_CTX['agent_types']
+        game_agents = [agent_types[j] for j in _WORKER_CTX['agent_schedule'][game_idx]]
+        
+        # Play a game, encoding its states straight into its rows of the shared buffer
+        first_row = (game_idx % batch_games) * COLLECTION_MAX_TURNS
+        game_result = play_single_game_for_downgrading(
+            game_agents,
+            max_turns=COLLECTION_MAX_TURNS,
+            dqn_observer=_WORKER_CTX['observer'],
+            states=states[first_row:first_row + COLLECTION_MAX_TURNS]
+        )
+        
+        downgrading_decisions = game_result.get('downgrading_decisions', [])
+        for decision in downgrading_decisions:
+            # Replace the view of the state by its row; the player object is
+            # not needed once rewards are assigned
+            del decision['state']
+            decision['state_index'] = first_row + decision['turn']
+            decision.pop('player', None)
+            
+            # Normalize actions to indices
+            decision['action'] = _action_to_index(decision.get('action'))
+        
+        return downgrading_decisions
+    
     except Exception as e:
-        print(f"Process {process_id} critical error: {e}")
+        print(f"Game {game_idx} error: {e}")
         import traceback
         traceback.print_exc()
+        return []
+
+@dataclass
+class Experiences:
+    """
+    Training examples stored as one array per field, row i being example i.
+    
+    States are quantized to int8 with one scale per feature; multiplying by
+    state_scale recovers the float32 features.
+    
+    Attributes:
+        states: Quantized encoded states, shape (N, state_dim), int8.
+        actions: Action indices, -1 for no downgrade, shape (N,), int32.
+        rewards: Rewards, shape (N,), float32.
+        next_states: Quantized states after the decision, shape (N, state_dim), int8.
+        dones: Episode end flags, shape (N,), float32.
+        state_scale: Scale of each state feature, shape (state_dim,), float32.
+    """
+    states: np.ndarray
+    actions: np.ndarray
+    rewards: np.ndarray
+    next_states: np.ndarray
+    dones: np.ndarray
+    state_scale: np.ndarray
+    
+    def __len__(self):
+        return len(self.actions)
     
-    print(f"Process {process_id} collected {len(downgrading_decisions)} downgrading decisions")
-    return downgrading_decisions
+    def dequantize(self, quantized_states):
+        """Recover float32 states from rows of states or next_states."""
+        return quantized_states.astype(np.float32) * self.state_scale
+
+def quantize_states(states):
+    """
+    Quantize float states to int8 with a symmetric scale per feature.
+    
+    Args:
+        states: Encoded states, shape (N, state_dim)
+        
+    Returns:
+        Tuple of (int8 states, float32 scale per feature)
+    """
+    scale = np.max(np.abs(states), axis=0, initial=0.0) / 127.0
+    
+    # Features that are always zero quantize to zero whatever their scale
+    scale[scale == 0] = 1.0
+    
+    quantized = np.round(states / scale).astype(np.int8)
+    return quantized, scale.astype(np.float32)
 
 def prepare_downgrading_experiences_for_training(downgrading_decisions):
     """
@@ -317,44 +498,38 @@ def prepare_downgrading_experiences_for_training(downgrading_decisions):
         downgrading_decisions: List of downgrading decision dictionaries
         
     Returns:
-        List of experience tuples (state, action, reward, next_state, done)
+        Experiences holding the (state, action, reward, next_state, done) fields as arrays,
+        with states quantized to int8
     """
-    if not downgrading_decisions:
-        return []
+    num_decisions = len(downgrading_decisions)
+    state_dim = len(downgrading_decisions[0]['state']) if downgrading_decisions else 0
     
-    experiences = []
+    states = np.empty((num_decisions, state_dim), dtype=np.float32)
+    actions = np.empty(num_decisions, dtype=np.int32)
+    rewards = np.empty(num_decisions, dtype=np.float32)
     
-    # Create a mapping of property group names to indices
-    property_group_indices = {group.value: i for i, group in enumerate(PropertyGroup)}
-    
-    for decision in downgrading_decisions:
+    for i, decision in enumerate(downgrading_decisions):
         # Basic structure of an experience
-        state = decision['state']
+        states[i] = decision['state']
         
         # Handle different action types
-        action = decision['action']
-        
-        # Convert string property group values to indices
-        if isinstance(action, str) and action in property_group_indices:
-            action = property_group_indices[action]
-        # Keep numeric actions as-is (including -1 for no downgrade)
-        elif isinstance(action, (int, float)):
-            action = int(action)
-        else:
-            # Default to no downgrade if action is invalid
-            action = -1
-            
-        reward = decision['reward']
+        actions[i] = _action_to_index(decision['action'])
         
+        rewards[i] = decision['reward']
+    
+    # Stored states take a quarter of the float32 memory; training dequantizes them
+    states, state_scale = quantize_states(states)
+    
+    return Experiences(
+        states=states,
+        actions=actions,
+        rewards=rewards,
         # Use the same state as next_state since we don't track it
-        next_state = decision['state']
-        
+        next_states=states,
         # Always done since these are isolated decisions
-        done = 1.0
-        
-        experiences.append((state, action, reward, next_state, done))
-    
-    return experiences
+        dones=np.ones(num_decisions, dtype=np.float32),
+        state_scale=state_scale
+    )
 
 def pretrain_dqn_for_downgrading(dqn_agent, experiences, batch_size=32, epochs=5):
     """
@@ -362,7 +537,7 @@ def pretrain_dqn_for_downgrading(dqn_agent, experiences, batch_size=32, epochs=5
     
     Args:
         dqn_agent: DQN agent to train
-        experiences: List of experience tuples
+        experiences: Experiences to train on
         batch_size: Batch size for training
         epochs: Number of training epochs
         
@@ -376,26 +551,54 @@ def pretrain_dqn_for_downgrading(dqn_agent, experiences, batch_size=32, epochs=5
         'loss': []
     }
     
-    # Add all experiences to agent's memory
-    for exp in experiences:
-        dqn_agent.memory['get_downgrading_suggestions'].append(exp)
+    # Add experiences to agent's memory; only the most recent ones fit, so only
+    # those are dequantized, as memory is sampled with float states
+    memory = dqn_agent.memory['get_downgrading_suggestions']
+    recent = slice(-memory.maxlen, None) if memory.maxlen is not None else slice(None)
+    memory.extend(zip(
+        experiences.dequantize(experiences.states[recent]), experiences.actions[recent],
+        experiences.rewards[recent], experiences.dequantize(experiences.next_states[recent]),
+        experiences.dones[recent]
+    ))
+    
+    # Feed the experience arrays through a shuffled input pipeline,
+    # PRETRAIN_INNER_BATCHES batches at a time, reshuffled every epoch;
+    # states stay int8 until a group of batches is dequantized for training
+    state_scale = tf.constant(experiences.state_scale)
+    
+    def dequantize_batches(states, actions, rewards, next_states, dones):
+        return (
+            tf.cast(states, tf.float32) * state_scale, actions, rewards,
+            tf.cast(next_states, tf.float32) * state_scale, dones
+        )
+    
+    dataset = (
+        tf.data.Dataset.from_tensor_slices((
+            experiences.states, experiences.actions, experiences.rewards,
+            experiences.next_states, experiences.dones
+        ))
+        .shuffle(max(len(experiences), 1))
+        .batch(batch_size, drop_remainder=True)
+        .batch(PRETRAIN_INNER_BATCHES)
+        .map(dequantize_batches)
+        .prefetch(tf.data.AUTOTUNE)
+    )
+    
+    # Calculate number of batches
+    num_batches = len(experiences) // batch_size
     
     # Train for multiple epochs
     for epoch in range(epochs):
         print(f"Epoch {epoch+1}/{epochs}")
         
-        # Calculate number of batches
-        num_batches = len(experiences) // batch_size
-        
         # Track epoch stats
         epoch_loss = []
         
-        # Train on batches
-        for _ in tqdm(range(num_batches), desc="Training batches"):
-            # Train on a batch and get loss
-            loss = dqn_agent.train_on_batch('get_downgrading_suggestions')
-            if loss is not None:
-                epoch_loss.append(loss)
+        # Train on groups of batches, one compiled call each
+        for batches in tqdm(dataset, total=ceil(num_batches / PRETRAIN_INNER_BATCHES), desc="Training batches"):
+            losses = dqn_agent.train_on_batches('get_downgrading_suggestions', *batches)
+            if losses is not None:
+                epoch_loss.extend(losses)
         
         # Add average loss for this epoch
         if epoch_loss:
@@ -405,7 +608,97 @@ def pretrain_dqn_for_downgrading(dqn_agent, experiences, batch_size=32, epochs=5
     
     return stats
 
-def play_evaluation_games(dqn_agent, num_games=50, max_turns=200):
+def _init_evaluation_worker(agent_config, network_weights):
+    """
+    Set up an evaluation worker process with a copy of the DQN agent.
+    
+    Args:
+        agent_config: DQNAgent constructor arguments of the evaluated agent
+        network_weights: Dictionary of method to (Q-network weights, target network weights)
+    """
+    # Evaluation runs small networks one state at a time, on the CPU
+    _limit_worker_tensorflow()
+    
+    # Rebuild the agent locally and copy the trained networks into it
+    eval_agent = DQNAgent(**agent_config)
+    for method, (q_weights, target_weights) in network_weights.items():
+        if method in eval_agent.q_networks:
+            eval_agent.q_networks[method].set_weights(q_weights)
+            eval_agent.target_networks[method].set_weights(target_weights)
+    
+    _WORKER_CTX['eval_agent'] = eval_agent
+
+def _play_one_eval_game(args):
+    """
+    Play one evaluation game between the worker's DQN agent and an opponent.
+    
+    Args:
+        args: Tuple of (opponent_cls, game_idx, max_turns)
+        
+    Returns:
+        Tuple of (opponent_key, outcome, dqn_net_worth), outcome being 'wins', 'losses' or 'draws'
+    """
+    opponent_cls, i, max_turns = args
+    dqn_agent = _WORKER_CTX['eval_agent']
+    
+    # Reset opponent for each game
+    opponent_instance = opponent_cls(f"{opponent_cls.__name__}_{i}")
+    
+    # Alternate who goes first
+    if i % 2 == 0:
+        players = [dqn_agent, opponent_instance]
+    else:
+        players = [opponent_instance, dqn_agent]
+    
+    # Reuse this worker's game manager, reset for the new players
+    game_manager = _WORKER_CTX.get('game_manager')
+    if game_manager is None:
+        game_manager = _WORKER_CTX['game_manager'] = GameManager(players)
+    else:
+        game_manager.reset(players)
+    
+    # Play the game
+    turn_counter = 0
+    active_players = len(players)
+    
+    try:
+        while active_players > 1 and turn_counter < max_turns:
+            try:
+                # Play a turn
+                game_manager.play_turn()
+            except BankrupcyException:
+                # Handle bankruptcy properly
+                active_players -= 1
+            except Exception as e:
+                print(f"Game error: {e}")
+            
+            # Change turn
+            game_manager.change_turn()
+            turn_counter += 1
+    except Exception as e:
+        print(f"Game error: {e}")
+    
+    # Calculate net worths
+    dqn_net_worth = game_manager.game_state.get_player_net_worth(dqn_agent)
+    opponent_net_worth = game_manager.game_state.get_player_net_worth(opponent_instance)
+    
+    # Determine winner
+    if game_manager.game_state.player_balances[dqn_agent] < 0:
+        outcome = 'losses'
+    elif game_manager.game_state.player_balances[opponent_instance] < 0:
+        outcome = 'wins'
+    else:
+        # Draw - compare net worth
+        if dqn_net_worth > opponent_net_worth:
+            outcome = 'wins'
+        elif dqn_net_worth < opponent_net_worth:
+            outcome = 'losses'
+        else:
+            outcome = 'draws'
+    
+    return opponent_cls.__name__, outcome, dqn_net_worth
+
+def play_evaluation_games(dqn_agent, num_games=50, max_turns=200, num_processes=None):
     """
     Evaluate the DQN agent's performance against other agents.
     
@@ -413,25 +706,28 @@ def play_evaluation_games(dqn_agent, num_games=50, max_turns=200):
         dqn_agent: DQN agent to evaluate
         num_games: Number of evaluation games
         max_turns: Maximum number of turns per game
+        num_processes: Number of processes to play games in
         
     Returns:
         Evaluation statistics
+        
+    Raises:
+        SystemExit: If the agent exits during a game, as it does when a method has
+            no network and may not fall back to the default implementation
+        BrokenProcessPool: If a worker process dies while games are pending
     """
     print(f"Evaluating DQN agent over {num_games} games...")
     
-    # Set the agent to evaluation mode
-    dqn_agent.training = False
-    
     # Opponents to test against
     opponents = [
-        StrategicAgent("Strategic"),
-        LateGameDeveloper("LateGame"),
-        CautiousAccumulator("Cautious")
+        StrategicAgent,
+        LateGameDeveloper,
+        CautiousAccumulator
     ]
     
     # Stats to track
     stats = {
-        opponent.__class__.__name__: {
+        opponent.__name__: {
             'wins': 0,
             'losses': 0,
             'draws': 0,
@@ -440,68 +736,49 @@ def play_evaluation_games(dqn_agent, num_games=50, max_turns=200):
         } for opponent in opponents
     }
     
-    # Play games
-    game_count = 0
-    for opponent in opponents:
-        for i in tqdm(range(num_games), desc=f"vs {opponent.__class__.__name__}"):
-            # Reset opponent for each game
-            opponent_instance = opponent.__class__(f"{opponent.__class__.__name__}_{i}")
-            
-            # Alternate who goes first
-            if i % 2 == 0:
-                players = [dqn_agent, opponent_instance]
-            else:
-                players = [opponent_instance, dqn_agent]
-            
-            # Create game
-            game_manager = GameManager(players)
-            
-            # Play the game
-            turn_counter = 0
-            active_players = len(players)
-            
-            try:
-                while active_players > 1 and turn_counter < max_turns:
-                    try:
-                        # Play a turn
-                        game_manager.play_turn()
-                    except BankrupcyException:
-                        # Handle bankruptcy properly
-                        active_players -= 1
-                    except Exception as e:
-                        print(f"Game error: {e}")
-                    
-                    # Change turn
-                    game_manager.change_turn()
-                    turn_counter += 1
-            except Exception as e:
-                print(f"Game error: {e}")
-            
-            # Record outcome
-            opponent_key = opponent.__class__.__name__
-            stats[opponent_key]['games_played'] += 1
-            
-            # Calculate net worths
-            dqn_net_worth = game_manager.game_state.get_player_net_worth(dqn_agent)
-            opponent_net_worth = game_manager.game_state.get_player_net_worth(opponent_instance)
-            
-            stats[opponent_key]['avg_net_worth'] += dqn_net_worth
-            
-            # Determine winner
-            if game_manager.game_state.player_balances[dqn_agent] < 0:
-                stats[opponent_key]['losses'] += 1
-            elif game_manager.game_state.player_balances[opponent_instance] < 0:
-                stats[opponent_key]['wins'] += 1
-            else:
-                # Draw - compare net worth
-                if dqn_net_worth > opponent_net_worth:
-                    stats[opponent_key]['wins'] += 1
-                elif dqn_net_worth < opponent_net_worth:
-                    stats[opponent_key]['losses'] += 1
-                else:
-                    stats[opponent_key]['draws'] += 1
-            
-            game_count += 1
+    if num_processes is None:
+        num_processes = _default_num_processes()
+    
+    # Workers evaluate their own copy of the agent, rebuilt from its settings
+    # and network weights, which are sent once per worker
+    agent_config = {
+        'name': dqn_agent.name,
+        'state_dim': dqn_agent.state_dim,
+        'hidden_dims': dqn_agent.hidden_dims,
+        'strategy_params': dqn_agent.strategy_params,
+        'training': False,  # Evaluation mode
+        'dqn_methods': dqn_agent.dqn_methods.copy(),
+        'active_training_method': dqn_agent.active_training_method,
+        'can_use_defaults_methods': dqn_agent.can_use_defaults_methods.copy()
+    }
+    network_weights = {
+        method: (dqn_agent.q_networks[method].get_weights(), dqn_agent.target_networks[method].get_weights())
+        for method in dqn_agent.q_networks
+    }
+    
+    # Play games, gathering outcomes as they finish. Unlike a Pool, the executor
+    # hands a game's SystemExit back to this process and fails when a worker dies,
+    # so a lost game stops the evaluation instead of leaving it waiting forever
+    tasks = [(opponent, i, max_turns) for opponent in opponents for i in range(num_games)]
+    if tasks:
+        executor = ProcessPoolExecutor(
+            max_workers=num_processes,
+            mp_context=_get_pool_context(),
+            initializer=_init_evaluation_worker,
+            initargs=(agent_config, network_weights)
+        )
+        try:
+            futures = [executor.submit(_play_one_eval_game, task) for task in tasks]
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Evaluation games"):
+                opponent_key, outcome, dqn_net_worth = future.result()
+                
+                # Record outcome
+                stats[opponent_key]['games_played'] += 1
+                stats[opponent_key]['avg_net_worth'] += dqn_net_worth
+                stats[opponent_key][outcome] += 1
+        finally:
+            # Games not yet started are dropped when the evaluation fails
+            executor.shutdown(cancel_futures=True)
     
     # Calculate average net worth
     for opponent_key in stats:
@@ -520,9 +797,6 @@ def play_evaluation_games(dqn_agent, num_games=50, max_turns=200):
         win_rate = opponent_stats['wins'] / opponent_stats['games_played'] if opponent_stats['games_played'] > 0 else 0
         print(f"  vs {opponent_key}: {win_rate:.2%} win rate, {opponent_stats['avg_net_worth']:.2f}₩ avg net worth")
     
-    # Set the agent back to training mode
-    dqn_agent.training = True
-    
     return {
         'overall_win_rate': overall_win_rate,
         'opponent_stats': stats
@@ -565,6 +839,9 @@ def train_dqn_downgrading_through_gameplay(
         CautiousAccumulator
     ]
     
+    # Draw the opponent of every game up front, as indices into opponents
+    opponent_schedule = np.random.randint(0, len(opponents), size=num_games)
+    
     # Training stats
     stats = {
         'game_returns': [],
@@ -572,127 +849,188 @@ def train_dqn_downgrading_through_gameplay(
         'epsilon': []
     }
     
-    # Rolling stats
+    # Rolling stats, with running sums so window means cost O(1) per game
     returns_window = deque(maxlen=100)
     wins_window = deque(maxlen=100)
+    returns_sum = 0.0
+    wins_sum = 0.0
+    
+    # Plots still being rendered in the background
+    plot_futures = []
     
-    # Play games
-    for game_idx in tqdm(range(num_games), desc="Training games"):
-        # Set agent to training mode
-        dqn_agent.training = True
+    # The agent's pending-decision dict, looked up once; its entries are replaced as decisions are made
+    current_decisions = dqn_agent.current_decisions
+    
+    # Game manager shared by all training games
+    game_manager = None
+    
+    # Per-game stats are appended as JSON lines, so checkpoints never re-serialize the history;
+    # the log is closed, with its buffered tail written, however training ends
+    with open(os.path.join(save_path, "training_stats.jsonl"), 'wb') as stats_log:
+        # Play games
+        for game_idx in tqdm(range(num_games), desc="Training games"):
+            # Set agent to training mode
+            dqn_agent.training = True
         
-        # Select opponent
-        opponent_type = random.choice(opponents)
-        opponent = opponent_type(f"{opponent_type.__name__}_{game_idx}")
+            # Select opponent
+            opponent_type = opponents[opponent_schedule[game_idx]]
+            opponent = opponent_type(f"{opponent_type.__name__}_{game_idx}")
         
-        # Alternate who goes first
-        if game_idx % 2 == 0:
-            players = [dqn_agent, opponent]
-        else:
-            players = [opponent, dqn_agent]
+            # Alternate who goes first
+            if game_idx % 2 == 0:
+                players = [dqn_agent, opponent]
+            else:
+                players = [opponent, dqn_agent]
         
-        # Create game
-        game_manager = GameManager(players)
+            # Create the game manager once, then reset it for every later game
+            if game_manager is None:
+                game_manager = GameManager(players)
+            else:
+                game_manager.reset(players)
         
-        # Track game progress
-        turn_counter = 0
-        active_players = len(players)
-        game_return = 0.0
+            # Track game progress
+            turn_counter = 0
+            active_players = len(players)
+            game_return = 0.0
         
-        try:
-            while active_players > 1 and turn_counter < max_turns:
-                current_player_idx = game_manager.game_state.current_player_index
-                current_player = players[current_player_idx]
+            try:
+                while active_players > 1 and turn_counter < max_turns:
+                    current_player_idx = game_manager.game_state.current_player_index
+                    current_player = players[current_player_idx]
                 
-                # If it's the DQN agent's turn
-                if current_player == dqn_agent:
-                    # Update previous downgrading decision with current state
-                    if dqn_agent.current_decisions['get_downgrading_suggestions']:
-                        dqn_agent.update_decision('get_downgrading_suggestions', game_manager.game_state)
+                    # If it's the DQN agent's turn
+                    if current_player is dqn_agent:
+                        # Update previous downgrading decision with current state
+                        if current_decisions['get_downgrading_suggestions']:
+                            dqn_agent.update_decision('get_downgrading_suggestions', game_manager.game_state)
                 
-                # Play a turn
-                try:
-                    game_manager.play_turn()
-                except BankrupcyException:
-                    # Handle bankruptcy properly
-                    active_players -= 1
-                except Exception as e:
-                    print(f"Game error: {e}")
+                    # Play a turn
+                    try:
+                        game_manager.play_turn()
+                    except BankrupcyException:
+                        # Handle bankruptcy properly
+                        active_players -= 1
+                    except Exception as e:
+                        print(f"Game error: {e}")
                 
-                # Change turn
-                game_manager.change_turn()
-                turn_counter += 1
+                    # Change turn
+                    game_manager.change_turn()
+                    turn_counter += 1
             
-            # Game ended - calculate final outcome
-            is_winner = False
-            if dqn_agent in game_manager.game_state.players and game_manager.game_state.player_balances[dqn_agent] >= 0:
-                for p in game_manager.game_state.players:
-                    if p != dqn_agent and game_manager.game_state.player_balances[p] < 0:
-                        is_winner = True
-                        break
+                # Game ended - calculate final outcome
+                is_winner = False
+                if dqn_agent in game_manager.game_state.players and game_manager.game_state.player_balances[dqn_agent] >= 0:
+                    for p in game_manager.game_state.players:
+                        if p != dqn_agent and game_manager.game_state.player_balances[p] < 0:
+                            is_winner = True
+                            break
             
-            # Calculate game return
-            agent_net_worth = game_manager.game_state.get_player_net_worth(dqn_agent)
-            game_return = agent_net_worth / 3000.0  # Normalize
-            if is_winner:
-                game_return += 1.0
+                # Calculate game return
+                agent_net_worth = game_manager.game_state.get_player_net_worth(dqn_agent)
+                game_return = agent_net_worth / 3000.0  # Normalize
+                if is_winner:
+                    game_return += 1.0
             
-            # Update rolling stats
-            returns_window.append(game_return)
-            wins_window.append(1.0 if is_winner else 0.0)
+                # Update rolling stats; once the windows are full, the oldest game leaves the sums
+                if len(wins_window) == wins_window.maxlen:
+                    returns_sum -= returns_window[0]
+                    wins_sum -= wins_window[0]
+                win = 1.0 if is_winner else 0.0
+                returns_window.append(game_return)
+                wins_window.append(win)
+                returns_sum += game_return
+                wins_sum += win
             
-            # Update overall stats
-            stats['game_returns'].append(game_return)
-            stats['win_rate'].append(np.mean(wins_window))
-            stats['epsilon'].append(dqn_agent.epsilon)
+                # Update overall stats
+                stats['game_returns'].append(game_return)
+                stats['win_rate'].append(wins_sum / len(wins_window))
+                stats['epsilon'].append(dqn_agent.epsilon)
+                stats_log.write(_dump_json_bytes({
+                    'game': game_idx,
+                    'return': float(game_return),
+                    'win': is_winner,
+                    'win_rate': stats['win_rate'][-1],
+                    'epsilon': float(dqn_agent.epsilon)
+                }) + b'\n')
             
-            # Finalize any pending downgrading decision
-            if dqn_agent.current_decisions['get_downgrading_suggestions']:
-                dqn_agent.update_decision('get_downgrading_suggestions', game_manager.game_state, done=True)
+                # Finalize any pending downgrading decision
+                if current_decisions['get_downgrading_suggestions']:
+                    dqn_agent.update_decision('get_downgrading_suggestions', game_manager.game_state, done=True)
             
-            # Evaluate periodically
-            if (game_idx + 1) % evaluation_interval == 0:
-                eval_stats = play_evaluation_games(dqn_agent, num_games=evaluation_games)
-                print(f"Evaluation after {game_idx+1} games:")
-                print(f"  Win rate: {eval_stats['overall_win_rate']:.2%}")
+                # Evaluate periodically
+                if (game_idx + 1) % evaluation_interval == 0:
+                    eval_stats = play_evaluation_games(dqn_agent, num_games=evaluation_games)
+                    print(f"Evaluation after {game_idx+1} games:")
+                    print(f"  Win rate: {eval_stats['overall_win_rate']:.2%}")
             
-            # Save periodically
-            if (game_idx + 1) % save_interval == 0:
-                model_path = os.path.join(save_path, f"dqn_downgrading_game_{game_idx+1}")
-                dqn_agent.save_model_for_method('get_downgrading_suggestions', model_path)
-                print(f"Model saved to {model_path}")
+                # Save periodically
+                if (game_idx + 1) % save_interval == 0:
+                    model_path = os.path.join(save_path, f"dqn_downgrading_game_{game_idx+1}")
+                    dqn_agent.save_model_for_method('get_downgrading_suggestions', model_path)
+                    print(f"Model saved to {model_path}")
                 
-                # Plot and save stats
-                plot_training_stats(stats, filename=os.path.join(save_path, f"training_stats_{game_idx+1}.png"))
+                    # Plot stats in the background, from a snapshot the next games cannot change
+                    plot_futures.append(_plot_executor.submit(
+                        plot_training_stats,
+                        {key: list(values) for key, values in stats.items()},
+                        os.path.join(save_path, f"training_stats_{game_idx+1}.png")
+                    ))
                 
-                # Save stats to JSON
-                stats_path = os.path.join(save_path, f"training_stats_{game_idx+1}.json")
-                with open(stats_path, 'w') as f:
-                    json.dump(stats, f)
+                    # Flush the per-game log and save the latest aggregates
+                    stats_log.flush()
+                    _write_stats_summary(
+                        os.path.join(save_path, f"training_stats_{game_idx+1}.json"),
+                        _training_stats_summary(stats, returns_sum, returns_window)
+                    )
 
-                # clear memory
-                gc.collect()
+                    # clear memory
+                    gc.collect()
         
-        except Exception as e:
-            print(f"Error in game {game_idx}: {e}")
-            import traceback
-            traceback.print_exc()
+            except Exception as e:
+                print(f"Error in game {game_idx}: {e}")
+                import traceback
+                traceback.print_exc()
     
-    # Save final model
-    final_model_path = os.path.join(save_path, "dqn_downgrading_final")
-    dqn_agent.save_model_for_method('get_downgrading_suggestions', final_model_path)
-    print(f"Final model saved to {final_model_path}")
+        # Save final model
+        final_model_path = os.path.join(save_path, "dqn_downgrading_final")
+        dqn_agent.save_model_for_method('get_downgrading_suggestions', final_model_path)
+        print(f"Final model saved to {final_model_path}")
     
-    # Plot final stats
-    plot_training_stats(stats, filename=os.path.join(save_path, "training_stats_final.png"))
+        # Plot final stats and wait for every pending plot to be written
+        plot_futures.append(_plot_executor.submit(
+            plot_training_stats, stats, os.path.join(save_path, "training_stats_final.png")
+        ))
+        for future in plot_futures:
+            future.result()
     
-    # Save final stats to JSON
-    final_stats_path = os.path.join(save_path, "training_stats_final.json")
-    with open(final_stats_path, 'w') as f:
-        json.dump(stats, f)
+    # Save the final aggregates
+    _write_stats_summary(
+        os.path.join(save_path, "training_stats_final.json"),
+        _training_stats_summary(stats, returns_sum, returns_window)
+    )
     
     return stats
 
+def _dump_json_bytes(obj):
+    """Serialize obj to compact JSON bytes, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _training_stats_summary(stats, returns_sum, returns_window):
+    """Summarize the most recent training aggregates for a checkpoint."""
+    return {
+        'games': len(stats['game_returns']),
+        'mean_return': returns_sum / len(returns_window) if returns_window else 0.0,
+        'win_rate': stats['win_rate'][-1] if stats['win_rate'] else 0.0,
+        'epsilon': float(stats['epsilon'][-1]) if stats['epsilon'] else 0.0
+    }
+
+def _write_stats_summary(path, summary):
+    """Write the latest training aggregates to path as a small JSON file."""
+    with open(path, 'wb') as f:
+        f.write(_dump_json_bytes(summary))
+
 def plot_training_stats(stats, filename='training_stats.png'):
     """
     Plot training statistics.
@@ -701,25 +1039,27 @@ def plot_training_stats(stats, filename='training_stats.png'):
         stats: Dictionary of training statistics
         filename: Filename to save the plot
     """
-    plt.figure(figsize=(12, 8))
+    # A standalone Figure keeps pyplot's global state out of the background plotting thread
+    fig = Figure(figsize=(12, 8))
     
     # Plot each statistic
     for i, (key, values) in enumerate(stats.items(), 1):
-        plt.subplot(len(stats), 1, i)
-        plt.plot(values)
-        plt.title(key)
-        plt.grid(True)
+        ax = fig.add_subplot(len(stats), 1, i)
+        ax.plot(values)
+        ax.set_title(key)
+        ax.grid(True)
         
         # Add smoother trend line
         if len(values) > 10:
             window_size = min(len(values) // 5, 10)
-            smoothed = np.convolve(values, np.ones(window_size)/window_size, mode='valid')
-            plt.plot(range(window_size-1, len(values)), smoothed, 'r--', linewidth=2)
+            # Rolling mean as a difference of cumulative sums, one pass over the values
+            cumulative = np.cumsum(np.insert(np.asarray(values, dtype=np.float64), 0, 0.0))
+            smoothed = (cumulative[window_size:] - cumulative[:-window_size]) / window_size
+            ax.plot(range(window_size-1, len(values)), smoothed, 'r--', linewidth=2)
     
-    plt.tight_layout()
-    plt.savefig(filename)
+    fig.tight_layout()
+    fig.savefig(filename)
     print(f"Training stats saved to {filename}")
-    plt.close()
 
 class EpsilonConfig:
     def __init__(
@@ -768,25 +1108,33 @@ def calculate_epsilon_update_freq(epsilon_config: EpsilonConfig) -> int:
 
     return update_freq
 
-def plot_epsilon_decay(epsilon_config: EpsilonConfig) -> None:
+def epsilon_schedule(epsilon_config: EpsilonConfig) -> np.ndarray:
     """
-    Plot the decay of epsilon over the number of games.
+    Compute the epsilon value after every game.
 
     Args:
         epsilon_config: Configuration object for epsilon decay
+
+    Returns:
+        np.ndarray: Epsilon value of each game, of length num_games
     """
-    # Calculate the number of games to reach the end epsilon
     epsilon_update_freq = calculate_epsilon_update_freq(epsilon_config)
 
-    epsilon_updates = []
-    epsilon = epsilon_config.start
-    for game in range(epsilon_config.num_games):
-        if game % epsilon_update_freq == 0:
-            epsilon = max(epsilon * epsilon_config.decay, epsilon_config.end)
-        epsilon_updates.append(epsilon)
+    # Epsilon decays once at the start of every update period, including the first one
+    num_updates = np.arange(epsilon_config.num_games) // epsilon_update_freq + 1
+    return np.maximum(epsilon_config.start * epsilon_config.decay ** num_updates, epsilon_config.end)
+
+def plot_epsilon_decay(epsilon_config: EpsilonConfig) -> None:
+    """
+    Plot the decay of epsilon over the number of games.
+
+    Args:
+        epsilon_config: Configuration object for epsilon decay
+    """
+    epsilon_updates = epsilon_schedule(epsilon_config)
 
     plt.figure(figsize=(10, 6))
-    plt.plot(range(epsilon_config.num_games), epsilon_updates, label='Epsilon Decay')
+    plt.plot(epsilon_updates, label='Epsilon Decay')
     plt.title('Epsilon Decay Over Games')
     plt.xlabel('Games Played')
     plt.ylabel('Epsilon Value')
@@ -75,6 +75,14 @@ class MaxHousesReachedException(GameException):
         super().__init__(self.message)
 
 
+class InvalidHouseCountException(GameException):
+    """Raised when attempting to place fewer than one house per property at once."""
+    
+    def __init__(self, group_name: str, count: int):
+        self.message = f"Cannot place {count} houses on {group_name}, must place at least 1"
+        super().__init__(self.message)
+
+
 class IncompletePropertyGroupException(GameException):
     """Raised when attempting to build on a property group without owning all properties."""
     
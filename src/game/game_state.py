@@ -59,8 +59,15 @@ class GameState:
         Number of turns each player has spent in jail
     """
 
+    __slots__ = (
+        "players", "current_player_index", "properties", "houses", "hotels",
+        "escape_jail_cards", "in_jail", "player_positions", "player_balances",
+        "is_owned", "mortgaged_properties", "doubles_rolled", "board", "turns_in_jail",
+        "can_print_debug"
+    )
 
-    def __init__(self, players: list[Player]):
+
+    def __init__(self, players: list[Player], board: Board | None = None):
         """
         Initialize game state for the given players.
         
@@ -68,25 +75,55 @@ class GameState:
         ----------
         players : list[Player]
             List of Player objects participating in the game
+        board : Board | None, default None
+            Board to play on; a new one is loaded when not given. Boards hold
+            no game state, so one board can be shared by several game states
+        """
+        self.properties = {}
+        self.houses = {}
+        self.hotels = {}
+        self.escape_jail_cards = {}
+        self.in_jail = {}
+        self.player_positions = {}
+        self.player_balances = {}
+        self.is_owned = set()
+        self.mortgaged_properties = set()
+        self.board = board if board is not None else Board()
+        self.turns_in_jail = {}
+        self.reset(players)
+
+
+    def reset(self, players: list[Player]):
+        """
+        Reset to the start of a new game between the given players.
+        
+        The containers of the previous game are cleared and refilled in place and
+        the board is kept, so one game state can be reused across games.
+        
+        Parameters
+        ----------
+        players : list[Player]
+            List of Player objects participating in the new game
         """
         self.players = players
         self.current_player_index = 0
-        self.properties = { player: [] for player in players }
-        self.houses = {
-            group: (0, None) for group in PropertyGroup  # (count, owner)
-        }
-        self.hotels = {
-            group: (0, None) for group in PropertyGroup  # (count, owner)
-        }
-        self.escape_jail_cards = { player: 0 for player in players }
-        self.in_jail = { player: False for player in players }
-        self.player_positions = { player: 0 for player in players }
-        self.player_balances = { player: 1500 for player in players }
-        self.is_owned = set()
-        self.mortgaged_properties = set()
         self.doubles_rolled = 0
-        self.board = Board()
-        self.turns_in_jail = { player: 0 for player in players }
+        
+        self.properties.clear()
+        self.properties.update((player, []) for player in players)
+        for buildings in (self.houses, self.hotels):
+            buildings.update(dict.fromkeys(PropertyGroup, (0, None)))  # (count, owner)
+        for per_player, start in (
+            (self.escape_jail_cards, 0),
+            (self.in_jail, False),
+            (self.player_positions, 0),
+            (self.player_balances, 1500),
+            (self.turns_in_jail, 0)
+        ):
+            per_player.clear()
+            per_player.update(dict.fromkeys(players, start))
+        self.is_owned.clear()
+        self.mortgaged_properties.clear()
 
 
     ############## MOVING ACTIONS ##############
@@ -246,6 +283,39 @@ class GameState:
         custom_print(self.properties)
 
 
+    def buy_properties(self, player: Player, properties: list[Tile]):
+        """
+        Purchase several unowned properties for the player, in order.
+        
+        Each purchase is validated like buy_property, but the purchase log
+        is only built once for the whole batch.
+        
+        Parameters
+        ----------
+        player : Player
+            Player purchasing the properties
+        properties : list[Tile]
+            Properties to purchase
+        
+        Raises
+        ------
+        GameException
+            If a purchase is invalid (already owned, insufficient funds, etc.);
+            the properties before it remain purchased
+        """
+        for property in properties:
+            if error := GameValidation.validate_buy_property(self, player, property):
+                self.print_debug_info()
+                raise error
+        
+            self.properties[player].append(property)
+            self.is_owned.add(property)
+            self.player_balances[player] -= property.price
+
+        custom_print(f"{player} bought {', '.join(map(str, properties))} remaining balance: {self.player_balances[player]}₩")
+        custom_print(self.properties)
+
+
     def mortgage_property(self, player: Player, property: Tile):
         """
         Mortgage a property to get immediate cash at half property value.
@@ -343,6 +413,38 @@ class GameState:
         self.player_balances[player] -= cost
 
 
+    def place_houses(self, player: Player, property_group: PropertyGroup, count: int):
+        """
+        Add several houses to all properties in the group at once.
+        
+        Equivalent to calling place_house count times, except that nothing
+        is placed when any of the houses would be invalid.
+        
+        Parameters
+        ----------
+        player : Player
+            Player placing houses
+        property_group : PropertyGroup
+            Property group to develop
+        count : int
+            Number of houses to add to each property
+        
+        Raises
+        ------
+        GameException
+            If any of the house placements is invalid (no monopoly, too many houses,
+            insufficient funds, etc.)
+        """
+        if error := GameValidation.validate_place_houses(self, player, property_group, count):
+            self.print_debug_info()
+            raise error
+        
+        custom_print(f"{player} placed {count} houses on {property_group}")
+        cost = property_group.house_cost() * len(self.board.get_properties_by_group(property_group)) * count
+        self.houses[property_group] = (self.houses[property_group][0] + count, player)
+        self.player_balances[player] -= cost
+
+
     def place_hotel(self, player: Player, property_group: PropertyGroup):
         """
         Replace 4 houses with 1 hotel on all properties in the group.
@@ -972,6 +1074,22 @@ class GameState:
         return net_worth
 
 
+    def set_balance(self, player: Player, amount: int):
+        """
+        Overwrite a player's balance, bypassing the game rules.
+
+        Meant for setting up scenarios and restoring saved states.
+
+        Parameters
+        ----------
+        player : Player
+            Player whose balance is set
+        amount : int
+            New balance of the player
+        """
+        self.player_balances[player] = amount
+
+
     def configure_debug_mode(self, can_print: bool):
         """
         Enable or disable debug output for this game state.
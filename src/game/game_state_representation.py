@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from game.game_state import GameState
 from game.player import Player
 
@@ -18,12 +20,23 @@ class GameStateRepresentation:
         self.additional_data = additional_data
 
 
+    @cached_property
+    def game_state_view(self) -> dict:
+        """
+        JSON-serializable view of the game state, computed once per representation.
+
+        The representation is a snapshot: changes made to the game state after
+        the first access are not reflected.
+        """
+        return self.game_state.json_representation()
+
+
     def to_json(self) -> dict:
         """
         Convert the game state to a JSON-serializable dictionary.
         """
         json_representation = {}
-        json_representation['game_state'] = self.game_state.json_representation()
+        json_representation['game_state'] = self.game_state_view
         if self.additional_data:
             json_representation.update(self.additional_data)
         return json_representation
@@ -153,6 +153,36 @@ class GameValidation:
         return None
 
 
+    @staticmethod
+    def validate_place_houses(game_state: GameState, player: Player, property_group: PropertyGroup, count: int) -> Optional[GameException]:
+        """
+        Returns
+        -------
+        Optional[GameException]
+            InvalidHouseCountException, any exception of validate_place_house
+            for the first house, MaxHousesReachedException,
+            NotEnoughBalanceException, or None if all the houses can be placed
+        """
+        # A count below 1 would refund money and remove houses, or claim an empty group
+        if count < 1:
+            return InvalidHouseCountException(str(property_group), count)
+        
+        # The ownership, mortgage and hotel checks are the same for every house
+        if error := GameValidation.validate_place_house(game_state, player, property_group):
+            return error
+        
+        # Check if the extra houses stay within the maximum (4 per property)
+        if game_state.houses[property_group][0] + count > 4:
+            return MaxHousesReachedException(str(property_group))
+        
+        # Check if player has sufficient balance to buy every round of houses
+        cost = property_group.house_cost() * len(game_state.board.get_properties_by_group(property_group)) * count
+        if game_state.player_balances[player] < cost:
+            return NotEnoughBalanceException(cost, game_state.player_balances[player])
+        
+        return None
+
+
     @staticmethod
     def validate_place_hotel(game_state: GameState, player: Player, property_group: PropertyGroup) -> Optional[GameException]:
         """
@@ -511,17 +541,20 @@ class GameValidation:
                 
         # Validate properties offered by source player
         if trade_offer.properties_offered and len(trade_offer.properties_offered) > 0:
+            # Player holdings are lists; build the membership sets once per offer
+            source_properties = set(game_state.properties[trade_offer.source_player])
+            requested_properties = set(trade_offer.properties_requested or ())
             for property in trade_offer.properties_offered:
                 # Check if property is owned by anyone
                 if property not in game_state.is_owned:
                     return PropertyNotOwnedException(str(property))
                 
                 # Check if source player owns the property they're offering
-                if property not in game_state.properties[trade_offer.source_player]:
+                if property not in source_properties:
                     return NotPropertyOwnerException(str(property), str(trade_offer.source_player))
                 
                 # Check if property appears in both offered and requested lists
-                if property in trade_offer.properties_requested:
+                if property in requested_properties:
                     return PropertyInBothOfferedException(str(property))
                 
                 # Check if property is mortgaged (mortgaged properties can't be traded)
@@ -535,13 +568,14 @@ class GameValidation:
                     
         # Validate properties requested from target player
         if trade_offer.properties_requested and len(trade_offer.properties_requested) > 0:
+            target_properties = set(game_state.properties[trade_offer.target_player])
             for property in trade_offer.properties_requested:
                 # Check if property is owned by anyone
                 if property not in game_state.is_owned:
                     return PropertyNotOwnedException(str(property))
                 
                 # Check if target player owns the property being requested
-                if property not in game_state.properties[trade_offer.target_player]:
+                if property not in target_properties:
                     return NotPropertyOwnerException(str(property), str(trade_offer.target_player))
                 
                 # Check if property is mortgaged (mortgaged properties can't be traded)
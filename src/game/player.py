@@ -28,6 +28,8 @@ class Player(ABC):
         Maximum number of events to retain in history (default: 100)
     """
 
+    __slots__ = ("name", "event_queue", "event_history", "max_history", "can_be_referenced")
+
 
     def __init__(self, name: str, can_be_referenced: bool = False):
         """
@@ -27,6 +27,12 @@ class ChanceManager:
         self.event_manager = event_manager
 
 
+    def reset(self):
+        """Reshuffle the full deck and return the Get Out of Jail card to it, for a new game."""
+        self.__shuffle_cards()
+        self.get_out_of_jail_card_owner = None
+
+
     def __shuffle_cards(self):
         self.__shuffled_cards = list(range(len(self.chance_cards)))
         shuffle(self.__shuffled_cards)
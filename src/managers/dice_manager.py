@@ -46,6 +46,16 @@ class DiceManager:
         return tuple(self.cache.pop())
 
 
+    def reset(self):
+        """
+        Discard the remaining rolls and pre-generate a fresh cache for a new game.
+        
+        A reset manager rolls exactly like a newly created one from the same
+        random state.
+        """
+        self.cache = self.__get_cache()
+
+
     def __get_cache(self) -> list[tuple[int, int]]:
         """
         Generate a new cache of random dice roll pairs.
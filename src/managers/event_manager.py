@@ -170,6 +170,14 @@ class EventManager:
         return len(self.events) > 0
 
 
+    def reset(self):
+        """
+        Drop the pending events and the recent events history of the previous game.
+        """
+        self.events.clear()
+        self.recent_events.clear()
+
+
     def clear(self):
         """
         Remove all events from the processing queue.
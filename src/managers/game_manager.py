@@ -48,6 +48,31 @@ class GameManager:
         )
 
 
+    def reset(self, players: List[Player]):
+        """
+        Start a new game between the given players, reusing this manager.
+        
+        The game state and the managers are reset in place instead of being
+        rebuilt, keeping the board and the loaded card decks. Random numbers are
+        drawn in the same order as by the constructor, so a reset manager plays
+        the same game as a new one from the same random state.
+        """
+        self.players = players
+        self.game_state.reset(players)
+        self.event_manager.reset()
+        self.dice_manager.reset()
+        self.chance_manager.reset()
+        self.community_chest_manager.reset()
+        self.trade_manager.reset()
+        
+        # Register game started event
+        self.event_manager.register_event(
+            EventType.GAME_STARTED,
+            player=players[0],  # Use first player as reference
+            description="Monopoly game has started"
+        )
+
+
     def play_turn(self):
         current_player_index = self.game_state.current_player_index
         current_player = self.players[current_player_index]
@@ -183,7 +183,9 @@ class TournamentManager:
             num_workers: int = None,
             collect_turn_data: bool = False,
             save_event_log: bool = False,
-            excluded_parallel_players: List[Player] = None  # New parameter
+            excluded_parallel_players: List[Player] = None,  # New parameter
+            return_only_player: str = None,
+            game_seeds: List[int] = None
         ) -> Dict[str, Any]:
         """
         Run a round-robin tournament with 2-player games for all combinations of players.
@@ -197,6 +199,13 @@ class TournamentManager:
             collect_turn_data: Whether to collect detailed per-turn data
             save_event_log: Whether to save the full event log
             excluded_parallel_players: List of players that should be processed sequentially
+            return_only_player: Name of a player to report on; when given, only that player's
+                win rate, average net worth and survival rate are returned, and no rankings,
+                result files or visualizations are produced, along with the player's outcome
+                in each game
+            game_seeds: Random seeds of the games of each matchup, by game number; a seeded
+                game is played by fresh copies of the players and plays out the same way in
+                every tournament, so its outcome can be reused
                 
         Returns:
             Dictionary containing tournament results and statistics
@@ -264,7 +273,7 @@ class TournamentManager:
             print(f"Running {len(parallel_matchups)} matchups in parallel mode...")
             parallel_results = self._run_2player_games_parallel(
                 players, parallel_matchups, games_per_matchup, max_turns, 
-                collect_turn_data, save_event_log, num_workers
+                collect_turn_data, save_event_log, num_workers, game_seeds
             )
             game_results.extend(parallel_results)
         
@@ -275,14 +284,14 @@ class TournamentManager:
             
             sequential_results = self._run_2player_games_sequential(
                 players, excluded_matchups, games_per_matchup, max_turns,
-                collect_turn_data, save_event_log
+                collect_turn_data, save_event_log, game_seeds
             )
             game_results.extend(sequential_results)
         elif not parallel or not parallel_matchups:
             # Run all games sequentially if parallel is False or no parallel matchups
             game_results = self._run_2player_games_sequential(
                 players, matchups, games_per_matchup, max_turns,
-                collect_turn_data, save_event_log
+                collect_turn_data, save_event_log, game_seeds
             )
         
         # Add game results to tournament results
@@ -294,6 +303,16 @@ class TournamentManager:
         
         # Compute aggregate statistics
         self._compute_player_statistics(tournament_results)
+        
+        if return_only_player is not None:
+            player_stats = tournament_results["player_stats"].get(return_only_player, {})
+            return {
+                "win_rate": player_stats.get("win_rate", 0),
+                "avg_net_worth": player_stats.get("avg_final_net_worth", 0),
+                "survival_rate": player_stats.get("survival_rate", 0),
+                "games": self._player_game_outcomes(game_results, return_only_player)
+            }
+        
         self._compute_matchup_statistics(tournament_results)
         self._compute_overall_statistics(tournament_results)
         
@@ -348,13 +367,15 @@ class TournamentManager:
             
         return game_results
     
-    def _create_clean_player_instance(self, original_player: Player, game_suffix=""):
+    def _create_clean_player_instance(self, original_player: Player, game_suffix="", seeded=False):
         """
         Create a clean instance of a player for tournament games.
         
         Args:
             original_player: The original player instance
             game_suffix: Suffix to add to player name for uniqueness
+            seeded: Whether the game is seeded; other agents then play on a copy of the
+                original, so the state they build up in a game never reaches later games
             
         Returns:
             Clean player instance ready for tournament
@@ -398,6 +419,9 @@ class TournamentManager:
             
             print(f"Created clean DQN agent: {clean_agent.name} for game {game_suffix}")
             return clean_agent
+        elif seeded:
+            # A seeded game must play out the same whatever games came before it
+            return deepcopy(original_player)
         else:
             # For other referenceable agents, just return the original
             # (assuming they don't have problematic state)
@@ -410,7 +434,8 @@ class TournamentManager:
             games_per_matchup: int,
             max_turns: int,
             collect_turn_data: bool,
-            save_event_log: bool
+            save_event_log: bool,
+            game_seeds: Optional[List[int]] = None
         ) -> List[Dict[str, Any]]:
         """
         Run 2-player games sequentially for each matchup.
@@ -422,6 +447,7 @@ class TournamentManager:
             max_turns: Maximum turns per game
             collect_turn_data: Whether to collect detailed per-turn data
             save_event_log: Whether to save the full event log
+            game_seeds: Random seeds of the games of each matchup, by game number
             
         Returns:
             List of game result dictionaries
@@ -437,7 +463,9 @@ class TournamentManager:
         with tqdm(total=total_games, desc="Running sequential games") as pbar:
             # Run games for each matchup
             for player1_idx, player2_idx in matchups:
-                for _ in range(games_per_matchup):
+                for game_number in range(games_per_matchup):
+                    seed = game_seeds[game_number] if game_seeds is not None else None
+                    
                     # Store original player names for mapping
                     original_player1_name = players[player1_idx].name
                     original_player2_name = players[player2_idx].name
@@ -455,15 +483,17 @@ class TournamentManager:
 
                     player1 = self._create_clean_player_instance(
                         players[player1_idx], 
-                        f"_g{game_idx}"
+                        f"_g{game_idx}",
+                        seeded=seed is not None
                     )
                     player2 = self._create_clean_player_instance(
                         players[player2_idx], 
-                        f"_g{game_idx}"
+                        f"_g{game_idx}",
+                        seeded=seed is not None
                     )
                     
                     # Randomly decide player order for fairness
-                    if random.random() < 0.5:
+                    if self._game_random(seed).random() < 0.5:
                         game_players = [player1, player2]
                     else:
                         game_players = [player2, player1]
@@ -476,7 +506,7 @@ class TournamentManager:
                     
                     # Run the game and get results
                     game_result = self._run_single_game(
-                        game_players, game_idx, max_turns, collect_turn_data, save_event_log
+                        game_players, game_idx, max_turns, collect_turn_data, save_event_log, seed
                     )
                     
                     # Add matchup information to the result
@@ -563,7 +593,8 @@ class TournamentManager:
             max_turns: int,
             collect_turn_data: bool,
             save_event_log: bool,
-            num_workers: Optional[int] = None
+            num_workers: Optional[int] = None,
+            game_seeds: Optional[List[int]] = None
         ) -> List[Dict[str, Any]]:
         """
         Run 2-player games in parallel for each matchup.
@@ -576,6 +607,7 @@ class TournamentManager:
             collect_turn_data: Whether to collect detailed per-turn data
             save_event_log: Whether to save the full event log
             num_workers: Number of parallel workers (defaults to CPU count)
+            game_seeds: Random seeds of the games of each matchup, by game number
             
         Returns:
             List of game result dictionaries
@@ -588,7 +620,9 @@ class TournamentManager:
             
             # Submit all games to the executor
             for player1_idx, player2_idx in matchups:
-                for _ in range(games_per_matchup):
+                for game_number in range(games_per_matchup):
+                    seed = game_seeds[game_number] if game_seeds is not None else None
+                    
                     # This part should only receive matchups with not referenceble players
                     # So we can safely create new instances
                     player1_class = type(players[player1_idx])
@@ -599,7 +633,7 @@ class TournamentManager:
                     player2 = player2_class(f"{players[player2_idx].name}_{game_idx}")
                     
                     # Randomly decide player order for fairness
-                    if random.random() < 0.5:
+                    if self._game_random(seed).random() < 0.5:
                         game_players = [player1, player2]
                     else:
                         game_players = [player2, player1]
@@ -610,7 +644,7 @@ class TournamentManager:
                     # Submit the game
                     future = executor.submit(
                         self._run_single_game_with_matchup,
-                        game_players, game_idx, max_turns, collect_turn_data, save_event_log, matchup_info
+                        game_players, game_idx, max_turns, collect_turn_data, save_event_log, matchup_info, seed
                     )
                     futures.append(future)
                     game_idx += 1
@@ -638,7 +672,8 @@ class TournamentManager:
             max_turns: int,
             collect_turn_data: bool,
             save_event_log: bool,
-            matchup_info: Tuple[str, str]
+            matchup_info: Tuple[str, str],
+            seed: Optional[int] = None
         ) -> Dict[str, Any]:
         """
         Run a single game with matchup information.
@@ -650,12 +685,13 @@ class TournamentManager:
             collect_turn_data: Whether to collect detailed per-turn data
             save_event_log: Whether to save the full event log
             matchup_info: Tuple containing the players' names in the matchup
+            seed: Random seed of the game, if it should be reproducible
             
         Returns:
             Dictionary containing game results
         """
         game_result = self._run_single_game(
-            game_players, game_idx, max_turns, collect_turn_data, save_event_log
+            game_players, game_idx, max_turns, collect_turn_data, save_event_log, seed
         )
         game_result["matchup"] = matchup_info
         return game_result
@@ -666,7 +702,8 @@ class TournamentManager:
         game_idx: int, 
         max_turns: int,
         collect_turn_data: bool,
-        save_event_log: bool
+        save_event_log: bool,
+        seed: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Run a single game and collect statistics.
@@ -677,10 +714,16 @@ class TournamentManager:
             max_turns: Maximum number of turns
             collect_turn_data: Whether to collect detailed per-turn data
             save_event_log: Whether to save the full event log
+            seed: Random seed of the game, if it should be reproducible
             
         Returns:
             Dictionary containing game results
         """
+        # Dice rolls and agent decisions draw from the global generators
+        if seed is not None:
+            random.seed(seed)
+            np.random.seed(seed % 2**32)
+        
         # Store original player names for stat tracking
         original_names = {}
         for player in game_players:
@@ -799,6 +842,45 @@ class TournamentManager:
         
         return game_result
     
+    @staticmethod
+    def _game_random(seed: Optional[int]):
+        """Random generator for the setup of a game: seeded if given, the global one otherwise."""
+        return random.Random(seed) if seed is not None else random
+    
+    @staticmethod
+    def _player_game_outcomes(game_results: List[Dict[str, Any]], player_name: str) -> List[Dict[str, Any]]:
+        """
+        Outcome of each game for one player, ordered by game index.
+        
+        Args:
+            game_results: List of game result dictionaries
+            player_name: Original name of the player
+            
+        Returns:
+            One dictionary per game, with whether the game finished without error and,
+            for such games, whether the player won, survived and its final net worth
+        """
+        outcomes = []
+        for game in sorted(game_results, key=lambda game: game.get("game_index", 0)):
+            game_player_name = next(
+                (name for name in game.get("players", [])
+                 if game.get("name_mapping", {}).get(name, name) == player_name),
+                None
+            )
+            player_game_stats = game.get("player_stats", {}).get(game_player_name)
+            if "error" in game or not player_game_stats:
+                outcomes.append({"valid": False, "won": False, "survived": False, "net_worth": 0})
+                continue
+            
+            winner = game.get("winner")
+            outcomes.append({
+                "valid": True,
+                "won": game.get("name_mapping", {}).get(winner, winner) == player_name,
+                "survived": game_player_name not in game.get("bankrupt_players", []),
+                "net_worth": player_game_stats.get("final_net_worth", 0)
+            })
+        return outcomes
+    
     def _setup_event_logging(
             self, 
             game_manager: GameManager, 
@@ -26,6 +26,11 @@ class TradeManager:
         self.event_manager = event_manager
 
 
+    def reset(self):
+        """Drop the trades of the previous game."""
+        self.active_trades.clear()
+
+
     def execute_trade(
             self, 
             trade_offer: TradeOffer,
@@ -34,8 +34,14 @@ class Board:
     ----------
     tiles : List[Tile]
         Complete list of all board tiles sorted by position (0-39)
+    _tiles_by_name : Dict[str, Tile]
+        Name lookup table built once the tiles are loaded
+    _properties_by_group : Dict[PropertyGroup, List[Property]]
+        Properties of each color group, in board order
     """
 
+    __slots__ = ("tiles", "_tiles_by_name", "_properties_by_group")
+
 
     def __init__(self):
         """
@@ -63,6 +69,16 @@ class Board:
         self.tiles = properties + utilities + railways + other_tiles
         self.tiles.sort(key=lambda x: x.id)
 
+        # Keep the first tile for repeated names, as a scan by position would
+        self._tiles_by_name = {}
+        for tile in self.tiles:
+            self._tiles_by_name.setdefault(tile.name, tile)
+
+        self._properties_by_group = {group: [] for group in PropertyGroup}
+        for tile in self.tiles:
+            if isinstance(tile, Property):
+                self._properties_by_group[tile.group].append(tile)
+
 
     def get_jail_id(self) -> int:
         """
@@ -176,7 +192,7 @@ class Board:
         list[Property]
             List of all properties in the specified color group
         """
-        return [property for property in self.tiles if isinstance(property, Property) and property.group == group]
+        return list(self._properties_by_group.get(group, ()))
 
 
     def get_property_by_name(self, name: str) -> Property:
@@ -215,10 +231,27 @@ class Board:
             The tile with matching name, or None if not found
         """
 
-        for tile in self.tiles:
-            if tile.name == name:
-                return tile
-        return None
+        return self._tiles_by_name.get(name)
+    
+
+    def get_tiles_by_names(self, names: list[str]) -> list[Tile]:
+        """
+        Find several tiles by their names in one call.
+        
+        Parameters
+        ----------
+        names : list[str]
+            Names of the tiles to find
+            
+        Returns
+        -------
+        list[Tile]
+            The tiles with matching names, in the same order, with None for
+            names that are not found
+        """
+
+        tiles_by_name = self._tiles_by_name
+        return [tiles_by_name.get(name) for name in names]
     
 
     def get_utilities(self) -> list[Utility]:
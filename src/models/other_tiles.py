@@ -16,6 +16,8 @@ class Taxes(Tile):
         Amount of tax that must be paid when landing on this tile
     """
 
+    __slots__ = ("tax",)
+
 
     def __init__(self, id: int, name: str, tax: int):
         """
@@ -46,6 +48,8 @@ class Chance(Tile):
     and execute its instructions immediately.
     """
 
+    __slots__ = ()
+
     def __init__(self, id: int, name: str):
         """
         Initialize a chance tile.
@@ -72,6 +76,8 @@ class CommunityChest(Tile):
     deck and execute its instructions immediately.
     """
 
+    __slots__ = ()
+
 
     def __init__(self, id: int, name: str):
         """
@@ -99,6 +105,8 @@ class GoToJail(Tile):
     collecting $200 for passing Go, and must use normal jail escape methods.
     """
 
+    __slots__ = ()
+
 
     def __init__(self, id: int, name: str):
         """
@@ -132,6 +140,8 @@ class Jail(Tile):
         Amount that must be paid to immediately escape from jail
     """
 
+    __slots__ = ("fine",)
+
 
     def __init__(self, id: int, name: str):
         """
@@ -161,6 +171,8 @@ class FreeParking(Tile):
     be collected here, but the standard rules have no effect.
     """
 
+    __slots__ = ()
+
 
     def __init__(self, id: int, name: str):
         """
@@ -188,6 +200,8 @@ class Go(Tile):
     serves as the starting position and salary collection point for all players.
     """
 
+    __slots__ = ()
+
 
     def __init__(self, id: int, name: str):
         """
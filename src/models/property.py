@@ -34,6 +34,10 @@ class Property(Tile):
         Cost to unmortgage the property (typically mortgage * 1.1)
     """
 
+    __slots__ = ("group", "price", "base_rent", "full_group_rent", "house_rent", "hotel_rent", "mortgage", "buyback_price")
+
+    is_colored_property = True
+
 
     def __init__(
             self,
@@ -26,6 +26,8 @@ class Railway(Tile):
         Rent amounts for owning 1-4 railways [1_railway, 2_railway, 3_railway, 4_railway]
     """
 
+    __slots__ = ("price", "mortgage", "buyback_price", "rent")
+
 
     @classmethod
     def _load_attributes(cls):
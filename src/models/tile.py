@@ -12,8 +12,15 @@ class Tile:
         Board position (0-39) of this tile
     name : str
         Display name of the tile for UI and game messages
+    is_colored_property : bool
+        Class-level tag, True only for color group properties. Cheaper to
+        check in hot loops than an isinstance test against Property
     """
 
+    __slots__ = ("id", "name")
+
+    is_colored_property = False
+
 
     def __init__(self, id: int, name: str):
         """
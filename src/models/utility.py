@@ -29,6 +29,8 @@ class Utility(Tile):
         Unmortgage cost (shared by all utilities)
     """
 
+    __slots__ = ("price", "mortgage", "buyback_price")
+
 
     @classmethod
     def _load_attributes(cls):